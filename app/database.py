@@ -22,10 +22,12 @@ Usage in API routes:
 """
 
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
-from typing import Generator
+from sqlalchemy.pool import NullPool, QueuePool
+from typing import Dict, Generator, Optional
 import logging
 
 from app.config import settings
@@ -54,17 +56,53 @@ Engine Configuration:
 
 Connection pooling improves performance by reusing database connections
 instead of creating new ones for each request.
+
+The pool is per worker process. Sync endpoints run in the threadpool, so
+pool_size should cover the usual number of concurrent requests per worker
+(overflow absorbs bursts); when running many workers, keep
+workers * (pool_size + max_overflow) below the server's max_connections
+or put PgBouncer in front of PostgreSQL.
+
+With DB_USE_PGBOUNCER, DATABASE_URL points at PgBouncer (transaction
+pooling mode) and the engine opens connections without a local pool.
+
+Otherwise, with the psycopg driver (postgresql+psycopg://), psycopg
+prepares a statement server-side once it has run DB_PREPARE_THRESHOLD
+times on a connection (psycopg's default is 5), so
+PostgreSQL skips parsing and planning on later executions. Statements are
+compiled once by SQLAlchemy's compiled cache and sent with bound
+parameters, so each endpoint's query text is identical across requests
+and is prepared once per pooled connection.
 """
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=3600,  # Recycle connections after 1 hour
-    pool_pre_ping=True,  # Verify connections before using them
-    echo=settings.DEBUG,  # Log SQL statements in debug mode
-)
+# prepare_threshold is a psycopg 3 connection option; other drivers
+# (postgresql:// defaults to psycopg2, or pg8000) reject it
+_USES_PSYCOPG = make_url(settings.DATABASE_URL).get_driver_name() == "psycopg"
+
+if settings.DB_USE_PGBOUNCER:
+    # PgBouncer already pools server connections, so a second pool here
+    # would only pin them. Transaction pooling also hands each transaction
+    # a different server connection, which breaks server-side prepared
+    # statements; psycopg's automatic preparation is turned off
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={"prepare_threshold": None} if _USES_PSYCOPG else {},
+        echo=settings.DEBUG,  # Log SQL statements in debug mode
+    )
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        poolclass=QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before server/proxy idle timeouts
+        pool_pre_ping=True,  # Verify connections before using them
+        connect_args=(
+            {"prepare_threshold": settings.DB_PREPARE_THRESHOLD} if _USES_PSYCOPG else {}
+        ),
+        echo=settings.DEBUG,  # Log SQL statements in debug mode
+    )
 
 
 # ============================================================
@@ -83,11 +121,15 @@ Each Session represents a database transaction and should be:
 Configuration:
 - autocommit=False: Require explicit commit() calls for transactions
 - autoflush=False: Require explicit flush() calls to send changes to DB
+- expire_on_commit=False: Keep loaded attribute values after commit, so
+  building the response does not reload every object with a new SELECT
+  (sessions are request-scoped, so values cannot go stale across requests)
 - bind=engine: Bind this session factory to our database engine
 """
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
@@ -142,7 +184,7 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
         cursor.execute("SET statement_timeout = '30s'")
         cursor.close()
     except Exception as e:
-        logger.warning(f"Failed to set statement timeout: {e}")
+        logger.warning("Failed to set statement timeout: %s", e)
 
 
 # ============================================================
@@ -187,7 +229,7 @@ def get_db() -> Generator[Session, None, None]:
     except Exception as e:
         # If an exception occurred, rollback the transaction
         db.rollback()
-        logger.error(f"Database session error: {e}")
+        logger.error("Database session error: %s", e)
         raise
     finally:
         # Always close the session, even if an exception occurred
@@ -224,12 +266,13 @@ def init_db() -> None:
         # This is necessary for Base.metadata.create_all() to work
         from app.models import user, company, invitation, device  # noqa: F401
 
-        # Create all tables
+        # Create all tables, then any indexes added to existing tables
         Base.metadata.create_all(bind=engine)
+        create_missing_indexes(engine)
 
         logger.info("Database initialized successfully!")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
 
 
@@ -255,7 +298,7 @@ def drop_db() -> None:
         Base.metadata.drop_all(bind=engine)
         logger.warning("All tables dropped!")
     except Exception as e:
-        logger.error(f"Failed to drop database tables: {e}")
+        logger.error("Failed to drop database tables: %s", e)
         raise
 
 
@@ -293,10 +336,57 @@ def check_db_connection() -> bool:
         logger.info("Database connection is healthy")
         return True
     except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
+        logger.error("Database connection check failed: %s", e)
+        return False
+
+
+def ping_database() -> bool:
+    """
+    Check database connectivity without logging the result.
+
+    Used by the periodic health heartbeat, which runs in every worker and
+    logs status changes itself; check_db_connection() logs every call.
+
+    Returns:
+        bool: True if the database answered, False otherwise
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.debug("Database ping failed: %s", e)
         return False
 
 
+def get_pool_status() -> Dict[str, int]:
+    """
+    Get connection pool usage for monitoring.
+
+    A checked_out count near pool_size + max_overflow means requests are
+    about to queue for a connection (and time out after pool_timeout).
+
+    Returns:
+        dict: Pool size, idle, checked out and overflow connection counts
+            (empty when pooling is left to PgBouncer)
+
+    Example:
+        >>> get_pool_status()
+        {'size': 20, 'checked_in': 3, 'checked_out': 1, 'overflow': -16, 'max_overflow': 10}
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW
+    }
+
+
 # ============================================================
 # Transaction Context Manager
 # ============================================================
@@ -349,7 +439,7 @@ class DatabaseTransaction:
             else:
                 # Exception occurred, rollback the transaction
                 self.db.rollback()
-                logger.error(f"Transaction rolled back due to error: {exc_val}")
+                logger.error("Transaction rolled back due to error: %s", exc_val)
         finally:
             # Always close the session
             self.db.close()
@@ -369,3 +459,67 @@ __all__ = [
     "check_db_connection",
     "DatabaseTransaction",
 ]
+
+
+def create_missing_indexes(bind: Engine) -> None:
+    """
+    Create model indexes that are missing from existing tables.
+
+    Base.metadata.create_all() skips tables that already exist, so an index
+    added to a model later (such as the idx_invitations_pending_email
+    unique index that enforces one pending invitation per email) is never
+    created on a deployed database by it. This creates each such index
+    (CREATE [UNIQUE] INDEX ... only if it does not exist yet).
+
+    Args:
+        bind: Engine to run the DDL on
+
+    Raises:
+        IntegrityError: If a unique index cannot be built because existing
+            rows violate it (e.g. two pending invitations for one email);
+            resolve the duplicates and run again
+
+    Example:
+        >>> Base.metadata.create_all(bind=engine)
+        >>> create_missing_indexes(engine)
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+# ============================================================
+# Error Helpers
+# ============================================================
+
+def violated_constraint(error: IntegrityError) -> Optional[str]:
+    """
+    Get the name of the constraint or index an IntegrityError violated.
+
+    Lets callers turn only the violation they expect (e.g. a unique
+    index on a user-supplied value) into a client error, instead of
+    reporting every constraint failure the same way.
+
+    Args:
+        error: Error raised by a flush, commit or statement
+
+    Returns:
+        str: Constraint name reported by PostgreSQL, or None if the
+            driver does not expose it
+
+    Example:
+        >>> except IntegrityError as e:
+        >>>     if violated_constraint(e) == "idx_invitations_pending_email":
+        >>>         raise HTTPException(status_code=409, ...)
+        >>>     raise
+    """
+    # psycopg 3 and psycopg2 expose the server's error fields as .diag
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name
+
+    # pg8000 passes them as a dict keyed by PostgreSQL field codes
+    args = getattr(error.orig, "args", ())
+    if args and isinstance(args[0], dict):
+        return args[0].get("n")
+    return None
@@ -16,7 +16,7 @@ The super admin creates companies and invites the first admin.
 The admin then manages users and devices within their company.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -25,6 +25,12 @@ import uuid
 from app.database import Base
 
 
+# Names the unique subdomain constraint can have: the unique index created
+# by the model (unique=True, index=True) or the constraint from the SQL
+# in DATABASE_SCHEMA.md
+SUBDOMAIN_UNIQUE_CONSTRAINTS = ("ix_companies_subdomain", "companies_subdomain_key")
+
+
 class Company(Base):
     """
     Company Model Class
@@ -166,6 +172,9 @@ class Company(Base):
         "User",
         back_populates="company",
         cascade="all, delete-orphan",  # Delete users when company is deleted
+        # Let the ON DELETE CASCADE foreign key remove them; their audit logs
+        # and sent invitations are deleted by the delete_company endpoint
+        passive_deletes=True,
         lazy="select"
     )
 
@@ -174,6 +183,7 @@ class Company(Base):
         "Device",
         back_populates="company",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select"
     )
 
@@ -192,9 +202,18 @@ class Company(Base):
         "Invitation",
         back_populates="company",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select"
     )
 
+    # ========================================
+    # Indexes for Performance
+    # ========================================
+    __table_args__ = (
+        # Keyset pagination of the company list (newest first)
+        Index('idx_companies_created_at_id', created_at.desc(), id.desc()),
+    )
+
     # ========================================
     # Model Methods
     # ========================================
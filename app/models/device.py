@@ -18,17 +18,23 @@ The device model tracks:
 - Last activity timestamp for offline detection
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 import uuid
-import random
+import secrets
 
 from app.database import Base
 from app.config import settings
 
 
+# Names the unique device_code constraint can have: the unique index created
+# by the model (unique=True, index=True) or the constraint from the SQL
+# in DATABASE_SCHEMA.md
+DEVICE_CODE_UNIQUE_CONSTRAINTS = ("ix_devices_device_code", "devices_device_code_key")
+
+
 class Device(Base):
     """
     Device Model Class
@@ -214,6 +220,24 @@ class Device(Base):
         lazy="joined"
     )
 
+    # ========================================
+    # Indexes for Performance
+    # ========================================
+    __table_args__ = (
+        # Per-company online / linked device counts (company stats). Partial
+        # indexes only hold the flagged rows, so they stay small
+        Index(
+            'idx_devices_company_online',
+            'company_id',
+            postgresql_where=(is_online == True)
+        ),
+        Index(
+            'idx_devices_company_linked',
+            'company_id',
+            postgresql_where=(is_linked == True)
+        ),
+    )
+
     # ========================================
     # Model Methods
     # ========================================
@@ -228,9 +252,10 @@ class Device(Base):
 
         Example:
             >>> code = Device.generate_device_code()
-            >>> print(code)  # "7392"
+            >>> print(code)  # "0392"
         """
-        return str(random.randint(1000, 9999))
+        # Pairing codes grant account access, so use a CSPRNG
+        return f"{secrets.randbelow(10000):04d}"
 
     def regenerate_code(self):
         """
@@ -14,7 +14,7 @@ The invitation system works as follows:
 This ensures secure user onboarding with proper authorization checks.
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
@@ -26,6 +26,10 @@ from app.database import Base
 from app.config import settings
 
 
+# Unique partial index allowing one pending invitation per email
+PENDING_EMAIL_INDEX = "idx_invitations_pending_email"
+
+
 class InvitationStatus(str, enum.Enum):
     """
     Enumeration of invitation statuses.
@@ -212,6 +216,22 @@ class Invitation(Base):
         lazy="joined"
     )
 
+    # ========================================
+    # Indexes for Performance
+    # ========================================
+    __table_args__ = (
+        # At most one pending invitation per email, enforced by the database
+        # so send_invitation can insert without a pre-check SELECT
+        Index(
+            PENDING_EMAIL_INDEX,
+            'email',
+            unique=True,
+            postgresql_where=(status == InvitationStatus.PENDING)
+        ),
+        # Deleting a user removes the invitations they sent by this column
+        Index('idx_invitations_invited_by', 'invited_by'),
+    )
+
     # ========================================
     # Model Methods
     # ========================================
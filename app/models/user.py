@@ -16,7 +16,7 @@ Each user authenticates via Google SSO (Single Sign-On) and can:
 - Access features based on their role and permissions
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Enum as SQLEnum, and_, false, true
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -213,7 +213,7 @@ class User(Base):
     company = relationship(
         "Company",
         back_populates="users",
-        lazy="joined"  # Eager load company data when querying users
+        lazy="select"  # Load company only when accessed (permission checks use company_id)
     )
 
     # One-to-Many: User can have multiple Devices
@@ -221,6 +221,7 @@ class User(Base):
         "Device",
         back_populates="user",
         cascade="all, delete-orphan",  # Delete devices when user is deleted
+        passive_deletes=True,  # Let the ON DELETE CASCADE foreign key remove them
         lazy="select"  # Lazy load devices (only when accessed)
     )
 
@@ -251,6 +252,27 @@ class User(Base):
         lazy="select"
     )
 
+    # ========================================
+    # Indexes for Performance
+    # ========================================
+    __table_args__ = (
+        # Per-company user counts filtered by status / role (company stats)
+        Index('idx_users_company_active', 'company_id', 'is_active'),
+        Index('idx_users_company_role', 'company_id', 'role'),
+        # Keyset pagination of user listings (ORDER BY created_at, id)
+        Index('idx_users_created_at_id', 'created_at', 'id'),
+        # Company-scoped listings (admins always filter by company_id),
+        # with a partial variant for the common is_active=true filter
+        Index('idx_users_company_created_at_id', 'company_id', 'created_at', 'id'),
+        Index(
+            'idx_users_company_active_created_at_id',
+            'company_id',
+            'created_at',
+            'id',
+            postgresql_where=(is_active == True)
+        ),
+    )
+
     # ========================================
     # Model Methods
     # ========================================
@@ -262,7 +284,7 @@ class User(Base):
         Returns:
             bool: True if user is super admin, False otherwise
         """
-        return self.role == UserRole.SUPER_ADMIN
+        return self.role is UserRole.SUPER_ADMIN
 
     def is_admin(self) -> bool:
         """
@@ -271,7 +293,7 @@ class User(Base):
         Returns:
             bool: True if user is admin, False otherwise
         """
-        return self.role == UserRole.ADMIN
+        return self.role is UserRole.ADMIN
 
     def is_regular_user(self) -> bool:
         """
@@ -280,7 +302,7 @@ class User(Base):
         Returns:
             bool: True if user is regular user, False otherwise
         """
-        return self.role == UserRole.USER
+        return self.role is UserRole.USER
 
     def can_manage_company(self, company_id: uuid.UUID) -> bool:
         """
@@ -310,21 +332,49 @@ class User(Base):
         Admins can manage users in their company (except other admins).
         Regular users cannot manage other users.
 
+        The check only reads the role and company_id columns of both
+        users, so it never queries the database and needs no caching.
+
         Args:
             target_user: User object to check management rights for
 
         Returns:
             bool: True if user can manage the target user, False otherwise
         """
-        if self.is_super_admin():
+        role = self.role
+        if role is UserRole.SUPER_ADMIN:
             return True
-        if self.is_admin() and target_user.company_id == self.company_id:
+        if role is UserRole.ADMIN and target_user.company_id == self.company_id:
             # Admins cannot manage other admins
-            if target_user.is_admin() or target_user.is_super_admin():
-                return False
-            return True
+            return target_user.role is UserRole.USER
         return False
 
+    def manageable_users_clause(self):
+        """
+        SQL equivalent of can_manage_user() for use in WHERE clauses.
+
+        Lets UPDATE/DELETE statements enforce the management rules in the
+        database, in the same statement as the write, instead of loading
+        the target user first.
+
+        Returns:
+            ColumnElement: Boolean SQL expression over User columns
+
+        Example:
+            >>> db.execute(
+            >>>     update(User)
+            >>>     .where(User.id == user_id, current_user.manageable_users_clause())
+            >>>     .values(is_active=False)
+            >>> )
+        """
+        role = self.role
+        if role is UserRole.SUPER_ADMIN:
+            return true()
+        if role is UserRole.ADMIN:
+            # Admins cannot manage other admins
+            return and_(User.company_id == self.company_id, User.role == UserRole.USER)
+        return false()
+
     def update_last_login(self):
         """
         Update the last_login timestamp to current time.
@@ -18,7 +18,8 @@ Authentication Flow:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse, HTMLResponse
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
@@ -37,6 +38,9 @@ from app.schemas.auth import (
 )
 from app.utils.auth import (
     create_token_response,
+    forget_cached_token,
+    forget_cached_user,
+    oauth2_scheme,
     refresh_access_token,
     verify_token,
     get_current_user
@@ -46,6 +50,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Login lookup by email. lambda_stmt caches the statement by the lambda's
+# code location, so each login skips rebuilding and re-keying the query
+_USER_BY_EMAIL = lambda_stmt(lambda: select(User).where(User.email == bindparam("email")))
+
 
 # ============================================================
 # Google OAuth Configuration
@@ -113,12 +121,12 @@ async def google_login(invitation_token: str = None):
             prompt='consent'
         )
 
-        logger.info(f"Generated Google OAuth URL")
+        logger.info("Generated Google OAuth URL")
 
         return GoogleAuthURL(auth_url=authorization_url)
 
-    except Exception as e:
-        logger.error(f"Failed to generate OAuth URL: {e}")
+    except Exception:
+        logger.exception("Failed to generate OAuth URL")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to initiate Google authentication"
@@ -129,7 +137,7 @@ async def google_login(invitation_token: str = None):
     "/google/callback",
     summary="Google OAuth callback"
 )
-async def google_callback(
+def google_callback(
     code: str = None,
     state: str = None,
     error: str = None,
@@ -161,7 +169,7 @@ async def google_callback(
     """
     # Check for OAuth errors
     if error:
-        logger.error(f"Google OAuth error: {error}")
+        logger.error("Google OAuth error: %s", error)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Google authentication failed: {error}"
@@ -200,10 +208,10 @@ async def google_callback(
                 detail="Email not provided by Google"
             )
 
-        logger.info(f"Google OAuth successful for {email}")
+        logger.info("Google OAuth successful for %s", email)
 
         # Check if user exists
-        user = db.query(User).filter(User.email == email).first()
+        user = db.execute(_USER_BY_EMAIL, {"email": email}).scalar_one_or_none()
 
         if user:
             # Update existing user
@@ -211,14 +219,14 @@ async def google_callback(
             user.profile_picture_url = profile_picture
             user.update_last_login()
 
-            logger.info(f"Updated existing user: {email}")
+            logger.info("Updated existing user: %s", email)
 
         else:
             # Check if this is an invitation flow
             if state:  # state contains invitation token
                 # TODO: Validate invitation token and get role/company from invitation
                 # For now, create as regular user
-                logger.info(f"Creating new user from invitation: {email}")
+                logger.info("Creating new user from invitation: %s", email)
 
             # Check if this is the first user (should be super admin)
             user_count = db.query(User).count()
@@ -234,7 +242,7 @@ async def google_callback(
                     company_id=None,
                     is_active=True
                 )
-                logger.info(f"Created first user as super admin: {email}")
+                logger.info("Created first user as super admin: %s", email)
 
             else:
                 # Regular users must be invited
@@ -247,12 +255,11 @@ async def google_callback(
             db.add(user)
 
         db.commit()
-        db.refresh(user)
 
         # Generate JWT tokens
         token_response = create_token_response(user)
 
-        logger.info(f"Login successful for {email}")
+        logger.info("Login successful for %s", email)
 
         # Return HTML page with JavaScript to store tokens and redirect
         html_content = f"""
@@ -330,8 +337,8 @@ async def google_callback(
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Google OAuth callback failed: {e}", exc_info=True)
+    except Exception:
+        logger.exception("Google OAuth callback failed")
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -344,7 +351,7 @@ async def google_callback(
     response_model=TokenResponse,
     summary="Refresh access token"
 )
-async def refresh_token(
+def refresh_token(
     request: RefreshTokenRequest,
     db: Session = Depends(get_db)
 ):
@@ -372,13 +379,13 @@ async def refresh_token(
         }
     """
     try:
-        token_response = await refresh_access_token(request.refresh_token, db)
-        return JSONResponse(content=token_response)
+        token_response = refresh_access_token(request.refresh_token, db)
+        return ORJSONResponse(content=token_response)
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Token refresh failed: {e}")
+    except Exception:
+        logger.exception("Token refresh failed")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token"
@@ -390,15 +397,20 @@ async def refresh_token(
     status_code=status.HTTP_200_OK,
     summary="Logout user"
 )
-async def logout(current_user: User = Depends(get_current_user)):
+async def logout(
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user)
+):
     """
     Logout user.
 
     Note: Since we're using JWT tokens, actual logout is handled client-side
     by removing the tokens. This endpoint is provided for completeness and
-    can be used for audit logging.
+    can be used for audit logging. The token's verified payload and the
+    user's cached row are dropped from this worker's auth caches.
 
     Args:
+        token: Access token being discarded
         current_user: Currently authenticated user
 
     Returns:
@@ -409,7 +421,10 @@ async def logout(current_user: User = Depends(get_current_user)):
         Headers: Authorization: Bearer <token>
         Response: {"message": "Logged out successfully"}
     """
-    logger.info(f"User logged out: {current_user.email}")
+    forget_cached_token(token)
+    forget_cached_user(current_user.id)
+
+    logger.info("User logged out: %s", current_user.email)
 
     # TODO: Add to audit log
     # In a more sophisticated system, you might:
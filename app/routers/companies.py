@@ -16,16 +16,21 @@ Endpoints:
 - GET /companies/{id}/stats - Get company statistics
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from sqlalchemy import case, delete, func, insert, select, true, tuple_, update
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 import logging
+import orjson
 import uuid
 
-from app.database import get_db
+from app.database import get_db, violated_constraint
 from app.models.user import User, UserRole
-from app.models.company import Company
+from app.models.company import Company, SUBDOMAIN_UNIQUE_CONSTRAINTS
 from app.models.device import Device
+from app.models.invitation import Invitation
+from app.models.audit_log import AuditLog
 from app.schemas.company import (
     CompanyCreate,
     CompanyUpdate,
@@ -34,11 +39,16 @@ from app.schemas.company import (
     CompanyStatsResponse
 )
 from app.utils.auth import (
+    forget_all_cached_users,
     get_current_user,
     require_super_admin,
     require_admin,
     check_company_access
 )
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
+from app.utils.etag import etag_response
+from app.utils.stats_cache import company_stats_cache, invalidate_company_stats
+from app.utils.user_cache import forget_all_user_lookups
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +65,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     summary="Create new company"
 )
-async def create_company(
+def create_company(
     company_data: CompanyCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_super_admin())
@@ -79,39 +89,44 @@ async def create_company(
         HTTPException 409: If subdomain already exists
         HTTPException 403: If user is not super admin
     """
-    # Check if subdomain already exists
-    if company_data.subdomain:
-        existing = db.query(Company).filter(
-            Company.subdomain == company_data.subdomain
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Subdomain '{company_data.subdomain}' is already taken"
-            )
-
+    # Subdomain uniqueness is enforced by the database's unique index
     try:
-        # Create company
-        company = Company(
-            name=company_data.name,
-            subdomain=company_data.subdomain,
-            logo_url=company_data.logo_url,
-            max_users=company_data.max_users,
-            max_devices=company_data.max_devices,
-            is_active=True
-        )
+        # Create company with INSERT ... RETURNING, so the created row comes
+        # back in the same round-trip instead of a refresh SELECT
+        company = db.execute(
+            insert(Company).values(
+                name=company_data.name,
+                subdomain=company_data.subdomain,
+                logo_url=company_data.logo_url,
+                max_users=company_data.max_users,
+                max_devices=company_data.max_devices,
+                is_active=True
+            ).returning(Company)
+        ).scalar_one()
 
-        db.add(company)
         db.commit()
-        db.refresh(company)
 
-        logger.info(f"Company created: {company.name} by {current_user.email}")
+        logger.info("Company created: %s by %s", company.name, current_user.email)
 
         return company
 
-    except Exception as e:
+    except IntegrityError as e:
+        db.rollback()
+        # Only a duplicate subdomain is the client's conflict; any other
+        # constraint failure is reported as a server error below
+        if violated_constraint(e) in SUBDOMAIN_UNIQUE_CONSTRAINTS:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Subdomain '{company_data.subdomain}' is already taken"
+            )
+        logger.exception("Failed to create company")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create company"
+        )
+    except Exception:
         db.rollback()
-        logger.error(f"Failed to create company: {e}")
+        logger.exception("Failed to create company")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create company"
@@ -123,8 +138,10 @@ async def create_company(
     response_model=List[CompanyListResponse],
     summary="List all companies"
 )
-async def list_companies(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+def list_companies(
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of records to skip (use cursor instead)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: Session = Depends(get_db),
@@ -134,10 +151,19 @@ async def list_companies(
     List all companies (Super Admin only).
 
     Returns a paginated list of all companies in the system with
-    basic information and statistics.
+    basic information and statistics, newest first.
+
+    Pagination is keyset-based: when more companies exist, the cursor for
+    the next page is returned in the X-Next-Cursor response header and
+    should be passed back as the `cursor` query parameter.
+
+    The page is sent with an ETag; repeating the request with a matching
+    If-None-Match header returns an empty 304 Not Modified.
 
     Args:
-        skip: Number of records to skip (pagination)
+        request: Incoming request (used for If-None-Match)
+        cursor: Opaque cursor from the previous page
+        skip: Deprecated offset pagination, ignored when cursor is given
         limit: Maximum records to return (pagination)
         is_active: Filter by active status
         db: Database session
@@ -146,23 +172,54 @@ async def list_companies(
     Returns:
         List[CompanyListResponse]: List of companies
     """
-    query = db.query(Company)
+    # Per-company counts are aggregated once per table and joined in, so the
+    # whole page is fetched in a single round-trip instead of 1 + 2N queries
+    users_sq = (
+        db.query(User.company_id, func.count(User.id).label("n"))
+        .group_by(User.company_id)
+        .subquery()
+    )
+    devices_sq = (
+        db.query(Device.company_id, func.count(Device.id).label("n"))
+        .group_by(Device.company_id)
+        .subquery()
+    )
+
+    query = (
+        db.query(
+            Company,
+            func.coalesce(users_sq.c.n, 0),
+            func.coalesce(devices_sq.c.n, 0)
+        )
+        .outerjoin(users_sq, users_sq.c.company_id == Company.id)
+        .outerjoin(devices_sq, devices_sq.c.company_id == Company.id)
+        .options(raiseload("*"))
+    )
 
     # Apply filters
     if is_active is not None:
         query = query.filter(Company.is_active == is_active)
 
-    # Get companies
-    companies = query.offset(skip).limit(limit).all()
+    # Seek past the previous page on the (created_at, id) index
+    query = query.order_by(Company.created_at.desc(), Company.id.desc())
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(Company.created_at, Company.id) < (cursor_ts, cursor_id))
+    elif skip:
+        query = query.offset(skip)
 
-    # Add user and device counts
+    # Stream companies with their user and device counts in batches,
+    # fetching one extra row to detect whether another page follows
     result = []
-    for company in companies:
-        users_count = db.query(User).filter(User.company_id == company.id).count()
-        devices_count = db.query(Device).filter(Device.company_id == company.id).count()
+    last = None
+    has_more = False
+    for company, users_count, devices_count in query.limit(limit + 1).yield_per(50):
+        if len(result) == limit:
+            has_more = True
+            continue
 
         result.append({
-            "id": str(company.id),
+            "id": company.id,
             "name": company.name,
             "subdomain": company.subdomain,
             "logo_url": company.logo_url,
@@ -171,11 +228,16 @@ async def list_companies(
             "max_devices": company.max_devices,
             "current_users": users_count,
             "current_devices": devices_count,
-            "created_at": company.created_at.isoformat() if company.created_at else None,
-            "updated_at": company.updated_at.isoformat() if company.updated_at else None
+            "created_at": company.created_at,
+            "updated_at": company.updated_at
         })
+        last = company
+
+    headers = {}
+    if has_more:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
 
-    return result
+    return etag_response(request, orjson.dumps(result), headers=headers)
 
 
 @router.get(
@@ -183,7 +245,7 @@ async def list_companies(
     response_model=CompanyResponse,
     summary="Get company details"
 )
-async def get_company(
+def get_company(
     company_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -229,7 +291,7 @@ async def get_company(
     response_model=CompanyResponse,
     summary="Update company"
 )
-async def update_company(
+def update_company(
     company_id: uuid.UUID,
     company_data: CompanyUpdate,
     db: Session = Depends(get_db),
@@ -260,35 +322,34 @@ async def update_company(
         )
 
     try:
-        # Check subdomain uniqueness if being updated
-        if company_data.subdomain and company_data.subdomain != company.subdomain:
-            existing = db.query(Company).filter(
-                Company.subdomain == company_data.subdomain,
-                Company.id != company_id
-            ).first()
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f"Subdomain '{company_data.subdomain}' is already taken"
-                )
-
-        # Update fields
+        # Update fields (subdomain uniqueness is enforced by the database)
         update_data = company_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(company, field, value)
 
         db.commit()
-        db.refresh(company)
 
-        logger.info(f"Company updated: {company.name} by {current_user.email}")
+        logger.info("Company updated: %s by %s", company.name, current_user.email)
 
         return company
 
-    except HTTPException:
-        raise
-    except Exception as e:
+    except IntegrityError as e:
+        db.rollback()
+        # Only a duplicate subdomain is the client's conflict; any other
+        # constraint failure is reported as a server error below
+        if violated_constraint(e) in SUBDOMAIN_UNIQUE_CONSTRAINTS:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Subdomain '{company_data.subdomain}' is already taken"
+            )
+        logger.exception("Failed to update company")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update company"
+        )
+    except Exception:
         db.rollback()
-        logger.error(f"Failed to update company: {e}")
+        logger.exception("Failed to update company")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update company"
@@ -300,7 +361,7 @@ async def update_company(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete company"
 )
-async def delete_company(
+def delete_company(
     company_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_super_admin())
@@ -330,16 +391,29 @@ async def delete_company(
         )
 
     try:
+        # The company's users, devices and invitations are removed by
+        # ON DELETE CASCADE. The audit logs and sent invitations of those
+        # users would only have their user reference set to NULL, so they
+        # are deleted explicitly, as the ORM cascade did before (and as
+        # delete_user does)
+        company_user_ids = select(User.id).where(User.company_id == company_id)
+        db.execute(delete(Invitation).where(Invitation.invited_by.in_(company_user_ids)))
+        db.execute(delete(AuditLog).where(AuditLog.user_id.in_(company_user_ids)))
         db.delete(company)
         db.commit()
+        # The cascaded user deletes are unseen by the ORM, so drop every
+        # cached user: they must not keep authenticating or being served
+        # by GET /users/{id}
+        forget_all_cached_users()
+        forget_all_user_lookups()
 
-        logger.warning(f"Company deleted: {company.name} by {current_user.email}")
+        logger.warning("Company deleted: %s by %s", company.name, current_user.email)
 
         return None
 
-    except Exception as e:
+    except Exception:
         db.rollback()
-        logger.error(f"Failed to delete company: {e}")
+        logger.exception("Failed to delete company")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete company"
@@ -355,7 +429,7 @@ async def delete_company(
     response_model=CompanyResponse,
     summary="Deactivate company"
 )
-async def deactivate_company(
+def deactivate_company(
     company_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_super_admin())
@@ -374,37 +448,51 @@ async def deactivate_company(
     Returns:
         CompanyResponse: Deactivated company details
     """
-    company = db.query(Company).filter(Company.id == company_id).first()
-
-    if not company:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Company not found"
-        )
-
     try:
-        company.deactivate(db)
-        db.refresh(company)
-
-        logger.info(f"Company deactivated: {company.name} by {current_user.email}")
+        # UPDATE ... RETURNING flips the flag and returns the company in one
+        # round-trip, then its users and devices are switched off in bulk
+        company = db.execute(
+            update(Company)
+            .where(Company.id == company_id)
+            .values(is_active=False)
+            .returning(Company)
+        ).scalar_one_or_none()
+
+        if company is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found"
+            )
 
-        return company
+        db.execute(update(User).where(User.company_id == company_id).values(is_active=False))
+        db.execute(update(Device).where(Device.company_id == company_id).values(is_online=False))
+        db.commit()
+        # The bulk UPDATE fires no mapper events, so drop every cached user
+        # (authentication and GET /users/{id}) now that it has committed
+        forget_all_cached_users()
+        forget_all_user_lookups()
 
-    except Exception as e:
+    except (IntegrityError, OperationalError):
         db.rollback()
-        logger.error(f"Failed to deactivate company: {e}")
+        logger.exception("Failed to deactivate company")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to deactivate company"
         )
 
+    invalidate_company_stats(company_id)
+
+    logger.info("Company deactivated: %s by %s", company.name, current_user.email)
+
+    return company
+
 
 @router.post(
     "/{company_id}/activate",
     response_model=CompanyResponse,
     summary="Activate company"
 )
-async def activate_company(
+def activate_company(
     company_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_super_admin())
@@ -420,37 +508,120 @@ async def activate_company(
     Returns:
         CompanyResponse: Activated company details
     """
-    company = db.query(Company).filter(Company.id == company_id).first()
+    try:
+        company = db.execute(
+            update(Company)
+            .where(Company.id == company_id)
+            .values(is_active=True)
+            .returning(Company)
+        ).scalar_one_or_none()
+
+        if company is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found"
+            )
 
-    if not company:
+        db.commit()
+
+    except (IntegrityError, OperationalError):
+        db.rollback()
+        logger.exception("Failed to activate company")
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Company not found"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to activate company"
         )
 
-    try:
-        company.activate(db)
-        db.refresh(company)
+    invalidate_company_stats(company_id)
 
-        logger.info(f"Company activated: {company.name} by {current_user.email}")
+    logger.info("Company activated: %s by %s", company.name, current_user.email)
 
-        return company
+    return company
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to activate company: {e}")
+
+# ============================================================
+# Company Statistics
+# ============================================================
+
+def _compute_company_stats(db: Session, company_id: uuid.UUID) -> dict:
+    """
+    Compute statistics and usage information for a company.
+
+    Args:
+        db: Database session
+        company_id: Company UUID
+
+    Returns:
+        dict: Company statistics (CompanyStatsResponse shape)
+
+    Raises:
+        HTTPException 404: If company not found
+    """
+    # One conditional-aggregation scan per table. Each aggregate returns
+    # exactly one row, so both are cross-joined onto the company row and the
+    # whole report is fetched in a single round-trip
+    users_agg = db.query(
+        func.count(User.id).label("total"),
+        func.coalesce(func.sum(case((User.is_active == True, 1), else_=0)), 0).label("active"),
+        func.coalesce(func.sum(case((User.role == UserRole.ADMIN, 1), else_=0)), 0).label("admins")
+    ).filter(User.company_id == company_id).subquery()
+
+    devices_agg = db.query(
+        func.count(Device.id).label("total"),
+        func.coalesce(func.sum(case((Device.is_online == True, 1), else_=0)), 0).label("online"),
+        func.coalesce(func.sum(case((Device.is_linked == True, 1), else_=0)), 0).label("linked")
+    ).filter(Device.company_id == company_id).subquery()
+
+    row = db.query(
+        Company.name,
+        Company.max_users,
+        Company.max_devices,
+        users_agg.c.total,
+        users_agg.c.active,
+        users_agg.c.admins,
+        devices_agg.c.total,
+        devices_agg.c.online,
+        devices_agg.c.linked
+    ).select_from(Company).join(users_agg, true()).join(devices_agg, true()).filter(
+        Company.id == company_id
+    ).first()
+
+    if not row:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to activate company"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Company not found"
         )
 
+    (name, max_users, max_devices,
+     total_users, active_users, admin_users,
+     total_devices, online_devices, linked_devices) = row
+
+    return {
+        "company_id": str(company_id),
+        "company_name": name,
+        "users": {
+            "total": total_users,
+            "active": active_users,
+            "admins": admin_users,
+            "max_allowed": max_users,
+            "remaining": max_users - total_users
+        },
+        "devices": {
+            "total": total_devices,
+            "online": online_devices,
+            "linked": linked_devices,
+            "max_allowed": max_devices,
+            "remaining": max_devices - total_devices
+        }
+    }
+
 
 @router.get(
     "/{company_id}/stats",
     response_model=CompanyStatsResponse,
     summary="Get company statistics"
 )
-async def get_company_stats(
+def get_company_stats(
     company_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -477,50 +648,10 @@ async def get_company_stats(
             detail="You don't have access to this company"
         )
 
-    company = db.query(Company).filter(Company.id == company_id).first()
-
-    if not company:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Company not found"
-        )
+    cached = company_stats_cache.get(company_id)
+    if cached is not None:
+        return cached
 
-    # Get statistics
-    total_users = db.query(User).filter(User.company_id == company_id).count()
-    active_users = db.query(User).filter(
-        User.company_id == company_id,
-        User.is_active == True
-    ).count()
-    admin_users = db.query(User).filter(
-        User.company_id == company_id,
-        User.role == UserRole.ADMIN
-    ).count()
-
-    total_devices = db.query(Device).filter(Device.company_id == company_id).count()
-    online_devices = db.query(Device).filter(
-        Device.company_id == company_id,
-        Device.is_online == True
-    ).count()
-    linked_devices = db.query(Device).filter(
-        Device.company_id == company_id,
-        Device.is_linked == True
-    ).count()
-
-    return {
-        "company_id": str(company_id),
-        "company_name": company.name,
-        "users": {
-            "total": total_users,
-            "active": active_users,
-            "admins": admin_users,
-            "max_allowed": company.max_users,
-            "remaining": company.max_users - total_users
-        },
-        "devices": {
-            "total": total_devices,
-            "online": online_devices,
-            "linked": linked_devices,
-            "max_allowed": company.max_devices,
-            "remaining": company.max_devices - total_devices
-        }
-    }
+    stats = _compute_company_stats(db, company_id)
+    company_stats_cache.set(company_id, stats)
+    return stats
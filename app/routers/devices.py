@@ -10,23 +10,29 @@ Handles Smart TV device operations:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from datetime import datetime
 import logging
-import random
-import string
 
-from app.database import get_db
+from app.database import get_db, violated_constraint
 from app.models.user import User
-from app.models.device import Device
+from app.models.device import Device, DEVICE_CODE_UNIQUE_CONSTRAINTS
 from app.utils.auth import get_current_user
+from app.utils.stats_cache import invalidate_company_stats
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Number of fresh pairing codes to try before giving up on collisions
+DEVICE_CODE_ATTEMPTS = 5
+
 
 @router.post("/generate-code", summary="Generate device pairing code")
-async def generate_device_code(
+def generate_device_code(
     device_id: str,
     device_name: str,
     db: Session = Depends(get_db)
@@ -37,32 +43,55 @@ async def generate_device_code(
     The device (Smart TV) calls this to get a pairing code that
     users will enter to link the device to their account.
     """
-    # Generate 4-digit code
-    code = ''.join(random.choices(string.digits, k=4))
-
-    # Check if device exists
-    device = db.query(Device).filter(Device.device_id == device_id).first()
+    # Register the device or refresh its code in a single round-trip.
+    # device_code is unique, so retry with a fresh code on a collision.
+    for _ in range(DEVICE_CODE_ATTEMPTS):
+        code = Device.generate_device_code()
+        stmt = (
+            pg_insert(Device)
+            .values(
+                device_id=device_id,
+                device_name=device_name,
+                device_code=code,
+                is_online=True,
+                is_linked=False
+            )
+            .on_conflict_do_update(
+                index_elements=[Device.device_id],
+                set_={
+                    "device_code": code,
+                    "device_name": device_name,
+                    "is_online": True,
+                    "updated_at": datetime.utcnow()
+                }
+            )
+            .returning(Device.company_id)
+        )
 
-    if device:
-        # Update existing device
-        device.device_code = code
-        device.device_name = device_name
-        device.is_online = True
+        try:
+            company_id = db.execute(stmt).scalar_one()
+            db.commit()
+            break
+        except IntegrityError as e:
+            db.rollback()
+            # Only a taken pairing code is worth retrying with a new code
+            if violated_constraint(e) not in DEVICE_CODE_UNIQUE_CONSTRAINTS:
+                logger.exception("Failed to generate pairing code for device: %s", device_id)
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to generate pairing code"
+                )
     else:
-        # Create new device
-        device = Device(
-            device_id=device_id,
-            device_name=device_name,
-            device_code=code,
-            is_online=True,
-            is_linked=False
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Pairing code collision, please request a new code"
         )
-        db.add(device)
 
-    db.commit()
-    db.refresh(device)
+    # The Core upsert skips the mapper events that drop cached stats, and
+    # re-pairing a linked device marks it online again
+    invalidate_company_stats(company_id)
 
-    logger.info(f"Generated pairing code for device: {device_id}")
+    logger.info("Generated pairing code for device: %s", device_id)
 
     return {
         "device_id": device_id,
@@ -72,7 +101,7 @@ async def generate_device_code(
 
 
 @router.post("/link", summary="Link device to user account")
-async def link_device(
+def link_device(
     device_code: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -109,9 +138,8 @@ async def link_device(
     device.device_code = None  # Clear the code
 
     db.commit()
-    db.refresh(device)
 
-    logger.info(f"Device linked: {device.device_id} to user {current_user.email}")
+    logger.info("Device linked: %s to user %s", device.device_id, current_user.email)
 
     return {
         "message": "Device linked successfully",
@@ -121,31 +149,32 @@ async def link_device(
 
 
 @router.get("/my-devices", summary="Get current user's devices")
-async def get_my_devices(
+def get_my_devices(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all devices linked to the current user.
     """
-    devices = db.query(Device).filter(Device.user_id == current_user.id).all()
-
-    return [
-        {
-            "id": str(device.id),
-            "device_id": device.device_id,
-            "device_name": device.device_name,
-            "is_online": device.is_online,
-            "is_linked": device.is_linked,
-            "last_seen": device.last_seen.isoformat() if device.last_seen else None,
-            "created_at": device.created_at.isoformat() if device.created_at else None
-        }
-        for device in devices
-    ]
+    # Only the listed columns are selected, so no Device instances (or their
+    # joined user/company) are built
+    devices = db.query(
+        Device.id,
+        Device.device_id,
+        Device.device_name,
+        Device.is_online,
+        Device.is_linked,
+        Device.last_seen,
+        Device.created_at
+    ).filter(Device.user_id == current_user.id).all()
+
+    # Returned as ORJSONResponse directly so UUIDs and datetimes are encoded
+    # natively by orjson instead of being converted in Python first
+    return ORJSONResponse(content=[device._asdict() for device in devices])
 
 
 @router.delete("/{device_id}", summary="Unlink/delete device")
-async def delete_device(
+def delete_device(
     device_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -167,6 +196,6 @@ async def delete_device(
     db.delete(device)
     db.commit()
 
-    logger.info(f"Device deleted: {device.device_id} by {current_user.email}")
+    logger.info("Device deleted: %s by %s", device.device_id, current_user.email)
 
     return {"message": "Device deleted successfully"}
@@ -11,21 +11,153 @@ These endpoints are typically used by:
 Endpoints:
 - GET /health - Basic health check
 - GET /health/detailed - Detailed system status
+- GET /health/ready - Kubernetes readiness probe
+- GET /health/live - Kubernetes liveness probe
+- GET /health/metrics - Request duration percentiles
+
+Database Heartbeat:
+Probes do not query the database themselves. A background task started
+in the application lifespan (run_db_heartbeat) pings the database every
+HEALTH_CHECK_INTERVAL_SECONDS and stores the result, so the probe rate
+is decoupled from the database round-trip rate.
 """
 
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from typing import Dict
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, Optional
+from datetime import datetime
+import asyncio
 import logging
+import orjson
 
-from app.database import get_db, check_db_connection
+from app.database import get_pool_status, ping_database
 from app.config import settings
+from app.utils.etag import compute_etag, etag_response
+from app.utils.metrics import request_time_percentiles
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# ============================================================
+# Static Responses
+# ============================================================
+
+# The basic and liveness responses never change after startup, so they are
+# serialized once here instead of on every load balancer / kubelet probe
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION
+})
+_LIVE_BYTES = orjson.dumps({"status": "alive"})
+
+
+# ============================================================
+# Database Heartbeat
+# ============================================================
+
+# Result of the most recent database check (updated by run_db_heartbeat)
+_db_healthy: bool = False
+_db_checked_at: Optional[datetime] = None
+
+# Serialized /health/detailed body and its ETag, rebuilt once per heartbeat
+_detailed_body: bytes = b""
+_detailed_etag: str = ""
+
+
+def _build_detailed_status(healthy: bool) -> Dict:
+    """
+    Build the detailed health status for a database check result.
+
+    Args:
+        healthy: Whether the database responded
+
+    Returns:
+        dict: Detailed system status
+    """
+    db_status = "connected" if healthy else "disconnected"
+
+    return {
+        "status": "healthy" if healthy else "degraded",
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "environment": settings.APP_ENV,
+        "database": db_status,
+        "database_pool": get_pool_status(),
+        "components": {
+            "api": "operational",
+            "database": "operational" if healthy else "unavailable",
+            "encryption": "operational"
+        },
+        "features": {
+            "rate_limiting": settings.ENABLE_RATE_LIMITING,
+            "monitoring": settings.ENABLE_MONITORING,
+            "analytics": settings.ENABLE_ANALYTICS
+        }
+    }
+
+
+def _record_db_status(healthy: bool) -> None:
+    """
+    Store the result of a database check.
+
+    Also re-serializes the /health/detailed body, so its JSON encoding and
+    ETag hashing happen once per heartbeat rather than once per request.
+
+    Args:
+        healthy: Whether the database responded
+    """
+    global _db_healthy, _db_checked_at, _detailed_body, _detailed_etag
+    if healthy and (_db_checked_at is None or not _db_healthy):
+        logger.info("Database heartbeat status changed: healthy")
+    elif not healthy and (_db_checked_at is None or _db_healthy):
+        logger.warning("Database heartbeat status changed: unavailable")
+    _db_healthy = healthy
+    _db_checked_at = datetime.utcnow()
+    _detailed_body = orjson.dumps(_build_detailed_status(healthy))
+    _detailed_etag = compute_etag(_detailed_body)
+
+
+async def is_db_healthy() -> bool:
+    """
+    Get the cached database status.
+
+    Falls back to a direct check (in the threadpool, like the heartbeat)
+    if the heartbeat has not run yet, e.g. the application was started
+    without its lifespan.
+
+    Returns:
+        bool: True if the last database check succeeded
+    """
+    if _db_checked_at is None:
+        _record_db_status(await run_in_threadpool(ping_database))
+    return _db_healthy
+
+
+async def run_db_heartbeat() -> None:
+    """
+    Periodically check database connectivity and cache the result.
+
+    Runs until cancelled. The blocking check runs in the threadpool so
+    the event loop is never stalled by a slow database.
+
+    Example:
+        >>> task = asyncio.create_task(run_db_heartbeat())
+        >>> ...
+        >>> task.cancel()
+    """
+    while True:
+        _record_db_status(await run_in_threadpool(ping_database))
+        await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL_SECONDS)
+
+
+# ============================================================
+# Health Endpoints
+# ============================================================
+
 @router.get(
     "/health",
     status_code=status.HTTP_200_OK,
@@ -39,13 +171,9 @@ async def health_check():
     Use this for load balancer health checks.
 
     Returns:
-        dict: Health status
+        Response: Pre-serialized health status
     """
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get(
@@ -53,17 +181,21 @@ async def health_check():
     status_code=status.HTTP_200_OK,
     response_model=Dict
 )
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check(request: Request):
     """
     Detailed health check with system information.
 
     Checks:
     - Application status
-    - Database connectivity
+    - Database connectivity (from the background heartbeat)
+    - Connection pool usage (as of the last heartbeat)
     - Configuration status
 
+    The body is pre-serialized by the heartbeat and sent with an ETag;
+    a matching If-None-Match header gets an empty 304 response.
+
     Returns:
-        dict: Detailed system status
+        Response: Detailed system status
 
     Example Response:
         {
@@ -72,6 +204,13 @@ async def detailed_health_check(db: Session = Depends(get_db)):
             "version": "1.0.0",
             "environment": "development",
             "database": "connected",
+            "database_pool": {
+                "size": 20,
+                "checked_in": 3,
+                "checked_out": 2,
+                "overflow": -15,
+                "max_overflow": 10
+            },
             "components": {
                 "api": "operational",
                 "database": "operational",
@@ -79,36 +218,17 @@ async def detailed_health_check(db: Session = Depends(get_db)):
             }
         }
     """
-    # Check database connection
-    db_status = "connected" if check_db_connection() else "disconnected"
+    # Make sure at least one database check has been recorded
+    await is_db_healthy()
 
-    # Build health response
-    health_status = {
-        "status": "healthy" if db_status == "connected" else "degraded",
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.APP_ENV,
-        "database": db_status,
-        "components": {
-            "api": "operational",
-            "database": "operational" if db_status == "connected" else "unavailable",
-            "encryption": "operational"
-        },
-        "features": {
-            "rate_limiting": settings.ENABLE_RATE_LIMITING,
-            "monitoring": settings.ENABLE_MONITORING,
-            "analytics": settings.ENABLE_ANALYTICS
-        }
-    }
-
-    return health_status
+    return etag_response(request, _detailed_body, etag=_detailed_etag)
 
 
 @router.get(
     "/health/ready",
     status_code=status.HTTP_200_OK
 )
-async def readiness_check(db: Session = Depends(get_db)):
+async def readiness_check():
     """
     Kubernetes readiness probe endpoint.
 
@@ -118,12 +238,15 @@ async def readiness_check(db: Session = Depends(get_db)):
     Returns:
         dict: Readiness status
     """
-    if not check_db_connection():
+    if not await is_db_healthy():
         logger.error("Readiness check failed: database unavailable")
-        return {
-            "status": "not_ready",
-            "reason": "database_unavailable"
-        }
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "not_ready",
+                "reason": "database_unavailable"
+            }
+        )
 
     return {
         "status": "ready"
@@ -142,8 +265,34 @@ async def liveness_check():
     A failure here would indicate the container should be restarted.
 
     Returns:
-        dict: Liveness status
+        Response: Pre-serialized liveness status
     """
-    return {
-        "status": "alive"
-    }
+    return Response(content=_LIVE_BYTES, media_type="application/json")
+
+
+@router.get(
+    "/health/metrics",
+    status_code=status.HTTP_200_OK,
+    response_model=Dict
+)
+async def request_metrics():
+    """
+    Request duration percentiles.
+
+    Computed on demand from the most recent requests recorded by the
+    observability middleware (see app.utils.metrics). Kept async so it
+    runs on the event loop thread that records the samples.
+
+    Returns:
+        dict: Sample count and p50/p95/p99/max durations in microseconds
+
+    Example Response:
+        {
+            "samples": 10000,
+            "p50_us": 812,
+            "p95_us": 4120,
+            "p99_us": 9875,
+            "max_us": 48210
+        }
+    """
+    return request_time_percentiles()
@@ -10,16 +10,19 @@ Handles user invitation system:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import exists, insert, literal, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from typing import List
 from datetime import datetime, timedelta
 import logging
 import secrets
 import uuid
 
-from app.database import get_db
+from app.database import get_db, violated_constraint
 from app.models.user import User, UserRole
 from app.models.company import Company
-from app.models.invitation import Invitation
+from app.models.invitation import Invitation, PENDING_EMAIL_INDEX
 from app.schemas.invitation import InvitationCreate, InvitationResponse
 from app.utils.auth import get_current_user, require_admin
 from app.config import settings
@@ -30,7 +33,7 @@ router = APIRouter()
 
 
 @router.post("", response_model=InvitationResponse, status_code=status.HTTP_201_CREATED)
-async def send_invitation(
+def send_invitation(
     invitation_data: InvitationCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -39,59 +42,101 @@ async def send_invitation(
     Send an invitation to a new user (Admin only).
 
     The invited user will receive an email with a link to accept the invitation.
-    """
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == invitation_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User with this email already exists"
-        )
 
-    # Check if there's already a pending invitation
-    pending = db.query(Invitation).filter(
-        Invitation.email == invitation_data.email,
-        Invitation.status == "pending"
-    ).first()
-    if pending:
+    Raises:
+        HTTPException 400: If the current user belongs to no company
+        HTTPException 409: If a user with this email exists or an
+            invitation for it is already pending
+    """
+    # Invitations join the sender's company; a super admin has none
+    if current_user.company_id is None:
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Invitation already sent to this email"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You must belong to a company to send invitations"
         )
 
     # Generate invitation token
     token = secrets.token_urlsafe(32)
-
-    # Create invitation
-    invitation = Invitation(
-        email=invitation_data.email,
-        role=invitation_data.role,
-        company_id=current_user.company_id,
-        invited_by=current_user.id,
-        token=token,
-        status="pending",
-        expires_at=datetime.utcnow() + timedelta(hours=settings.INVITATION_TOKEN_EXPIRE_HOURS)
+    now = datetime.utcnow()
+
+    new_invitation = {
+        Invitation.id: uuid.uuid4(),
+        Invitation.email: invitation_data.email,
+        Invitation.role: invitation_data.role,
+        Invitation.company_id: current_user.company_id,
+        Invitation.invited_by: current_user.id,
+        Invitation.token: token,
+        Invitation.status: "pending",
+        Invitation.expires_at: now + timedelta(hours=settings.INVITATION_TOKEN_EXPIRE_HOURS),
+        Invitation.created_at: now
+    }
+
+    # Both conflict checks happen inside one INSERT ... SELECT ... RETURNING:
+    # - no row is inserted (and none returned) if a user with this email
+    #   already exists
+    # - a second pending invitation for the same email is rejected by the
+    #   idx_invitations_pending_email unique index
+    # The created row comes back in the same round-trip, so no pre-check
+    # SELECT or refresh SELECT is needed
+    row_if_no_user = select(
+        *[literal(value, column.type) for column, value in new_invitation.items()]
+    ).where(
+        ~exists().where(User.email == invitation_data.email)
     )
 
-    db.add(invitation)
-    db.commit()
-    db.refresh(invitation)
+    try:
+        invitation = db.execute(
+            insert(Invitation)
+            .from_select([column.key for column in new_invitation], row_if_no_user)
+            .returning(Invitation)
+        ).scalar_one_or_none()
+
+        if invitation is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User with this email already exists"
+            )
+
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if violated_constraint(e) == PENDING_EMAIL_INDEX:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Invitation already sent to this email"
+            )
+        logger.exception("Failed to create invitation")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create invitation"
+        )
 
     # TODO: Send invitation email
-    logger.info(f"Invitation sent to {invitation_data.email} by {current_user.email}")
+    logger.info("Invitation sent to %s by %s", invitation_data.email, current_user.email)
 
     return invitation
 
 
-@router.get("", summary="List invitations")
-async def list_invitations(
+@router.get("", response_model=List[InvitationResponse], summary="List invitations")
+def list_invitations(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
 ):
     """
     List all invitations for the current user's company.
+
+    Only the columns exposed by InvitationResponse are selected, so no
+    Invitation instances or related company/user rows are loaded.
     """
-    invitations = db.query(Invitation).filter(
+    invitations = db.query(
+        Invitation.id,
+        Invitation.email,
+        Invitation.role,
+        Invitation.company_id,
+        Invitation.status,
+        Invitation.expires_at,
+        Invitation.created_at
+    ).filter(
         Invitation.company_id == current_user.company_id
     ).all()
 
@@ -99,7 +144,7 @@ async def list_invitations(
 
 
 @router.delete("/{invitation_id}", summary="Cancel invitation")
-async def cancel_invitation(
+def cancel_invitation(
     invitation_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -121,6 +166,6 @@ async def cancel_invitation(
     invitation.status = "cancelled"
     db.commit()
 
-    logger.info(f"Invitation cancelled: {invitation.email} by {current_user.email}")
+    logger.info("Invitation cancelled: %s by %s", invitation.email, current_user.email)
 
     return {"message": "Invitation cancelled"}
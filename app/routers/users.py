@@ -13,36 +13,267 @@ Permissions:
 - Super Admin: Can manage all users
 - Admin: Can manage users in their company (except other admins)
 - User: Can only view/update their own profile
+
+Endpoints that query the database are plain `def` functions: FastAPI runs
+them in its threadpool, so blocking Session calls never stall the event
+loop while other requests are waiting.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy import delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session, raiseload
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 import logging
+import orjson
 import uuid
 
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.models.company import Company
+from app.models.invitation import Invitation
+from app.models.audit_log import AuditLog
 from app.schemas.user import (
     UserResponse,
     UserCreate,
     UserUpdate,
     UserPermissionsUpdate,
+    UserStatusUpdate,
     UserListResponse
 )
 from app.utils.auth import (
+    forget_cached_user,
     get_current_user,
     require_admin,
     require_super_admin,
     check_company_access
 )
+from app.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
+    encode_cursor,
+    decode_cursor
+)
+from app.utils.etag import etag_matches
+from app.utils.stats_cache import invalidate_company_stats
+from app.utils.user_cache import forget_user_after_commit, forget_user_lookup, user_lookup_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# ============================================================
+# Helpers
+# ============================================================
+
+# Columns read by UserResponse, for listings that skip ORM instances
+_USER_RESPONSE_FIELDS = list(UserResponse.model_fields)
+_USER_RESPONSE_COLUMNS = [getattr(User, field) for field in _USER_RESPONSE_FIELDS]
+
+
+def _users_response(users: List[User], status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize users as a UserResponse list with orjson.
+
+    Returning a Response skips FastAPI's response_model validation and
+    jsonable_encoder pass, which for bulk endpoints would otherwise build
+    and re-encode one Pydantic model per user. The route's response_model
+    is still used for the OpenAPI schema.
+
+    Args:
+        users: Users to return
+        status_code: HTTP status of the response
+
+    Returns:
+        Response: JSON array of UserResponse objects
+    """
+    return Response(
+        content=orjson.dumps([
+            {field: getattr(user, field) for field in _USER_RESPONSE_FIELDS}
+            for user in users
+        ]),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+@contextmanager
+def _transaction(db: Session, error_detail: str) -> Iterator[None]:
+    """
+    Run the body of a write endpoint as one transaction.
+
+    Commits when the block completes. Any HTTPException raised inside the
+    block (404, 403, 400, ...) rolls the transaction back and propagates
+    unchanged; database errors roll back, are logged and become a 500.
+
+    Args:
+        db: Database session
+        error_detail: Error message returned (and logged) on database errors
+
+    Raises:
+        HTTPException 500: If the database rejects the statements or commit
+
+    Example:
+        >>> with _transaction(db, "Failed to create user"):
+        ...     db.execute(...)
+    """
+    try:
+        yield
+        db.commit()
+    except HTTPException:
+        db.rollback()
+        raise
+    except (IntegrityError, OperationalError):
+        db.rollback()
+        logger.exception(error_detail)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=error_detail
+        )
+
+
+def _update_user(db: Session, user_id: uuid.UUID, *criteria, **values) -> Optional[User]:
+    """
+    Update columns of a user row with UPDATE ... RETURNING.
+
+    The returned row refreshes the session's User instance in the same
+    round-trip, so no db.refresh() is needed afterwards.
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        *criteria: Extra WHERE conditions the row must also match
+        **values: Column values to set
+
+    Returns:
+        User: Updated user, or None if no row matched
+    """
+    # Core UPDATE does not fire mapper events, so schedule the cache
+    # evictions here; they run once the caller's transaction commits
+    forget_user_after_commit(db, user_id)
+    return db.execute(
+        update(User).where(User.id == user_id, *criteria).values(**values).returning(User)
+    ).scalar_one_or_none()
+
+
+def _raise_not_manageable(db: Session, user_id: uuid.UUID, action: str) -> None:
+    """
+    Raise the error for a write that matched no manageable user.
+
+    Only runs on the failure path, to tell a missing user (404) from one
+    the current user may not manage (403).
+
+    Args:
+        db: Database session
+        user_id: User UUID
+        action: Verb used in the error message (e.g. "deactivate")
+
+    Raises:
+        HTTPException 404: If user not found
+        HTTPException 403: If the user exists
+    """
+    if not db.query(db.query(User.id).filter(User.id == user_id).exists()).scalar():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=f"You don't have permission to {action} this user"
+    )
+
+
+def _manage_user(
+    db: Session,
+    current_user: User,
+    user_id: uuid.UUID,
+    values: dict,
+    action: str
+) -> User:
+    """
+    Apply an admin change to another user and commit it.
+
+    Shared by the admin update, status and permission endpoints. The
+    management rules are part of the UPDATE's WHERE clause, so the
+    permission check and the write happen in one statement and cannot
+    race; only the given columns are written.
+
+    The UPDATE also requires at least one column to differ from its new
+    value, so a repeated request (e.g. a client retrying a deactivation)
+    writes nothing - no new row version, no updated_at bump - and the
+    user is returned as stored.
+
+    Args:
+        db: Database session
+        current_user: Current admin user
+        user_id: User UUID
+        values: Column values to set (nothing is written if empty)
+        action: Verb used in error messages (e.g. "deactivate")
+
+    Returns:
+        User: Updated user
+
+    Raises:
+        HTTPException 404: If user not found
+        HTTPException 403: If current_user cannot manage the user
+        HTTPException 500: If the update fails
+    """
+    can_manage = current_user.manageable_users_clause()
+
+    with _transaction(db, f"Failed to {action} user"):
+        user = None
+        if values:
+            changed = or_(*(
+                getattr(User, column).is_distinct_from(value)
+                for column, value in values.items()
+            ))
+            user = _update_user(db, user_id, can_manage, changed, **values)
+        if user is None:
+            # Nothing was written: read the (manageable) user as it is
+            user = (
+                db.query(User)
+                .options(raiseload("*"))
+                .filter(User.id == user_id, can_manage)
+                .first()
+            )
+
+    if user is None:
+        _raise_not_manageable(db, user_id, action)
+
+    if "is_active" in values:
+        invalidate_company_stats(user.company_id)
+
+    return user
+
+
+def _profile_response(request: Request, user: User) -> Response:
+    """
+    Build a user profile response with an ETag, or a 304 if unchanged.
+
+    The ETag is derived from the user's id and updated_at (bumped by every
+    write), so a matching If-None-Match is answered without serializing
+    the profile at all.
+
+    Args:
+        request: Incoming request
+        user: User to return
+
+    Returns:
+        Response: 200 with the UserResponse body, or 304 Not Modified
+    """
+    etag = f'"{user.id.hex}-{int(user.updated_at.timestamp() * 1_000_000):x}"'
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    body = orjson.dumps(UserResponse.model_validate(user).model_dump())
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 # ============================================================
 # User Creation
 # ============================================================
@@ -53,7 +284,7 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     summary="Create new user"
 )
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_super_admin())
@@ -78,57 +309,175 @@ async def create_user(
         HTTPException 403: If not a super admin
         HTTPException 404: If company not found
     """
-    # Check if user with this email already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email already exists"
-        )
-
-    # Validate company exists if company_id is provided
+    # Validate company exists if company_id is provided. The company and its
+    # user limit are read in a single round-trip: one SELECT of two scalar
+    # subqueries. max_users is NULL when the company does not exist
     if user_data.company_id:
-        company = db.query(Company).filter(Company.id == user_data.company_id).first()
-        if not company:
+        company_max_users = db.query(Company.max_users).filter(
+            Company.id == user_data.company_id
+        ).scalar_subquery()
+        company_active_users = db.query(func.count(User.id)).filter(
+            User.company_id == user_data.company_id,
+            User.is_active == True
+        ).scalar_subquery()
+
+        max_users, active_users = db.query(company_max_users, company_active_users).one()
+
+        if max_users is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Company not found"
             )
 
         # Check if company can add more users
-        if not company.can_add_user():
+        if active_users >= max_users:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Company has reached maximum user limit ({company.max_users})"
+                detail=f"Company has reached maximum user limit ({max_users})"
             )
 
-    try:
-        # Create new user
-        new_user = User(
-            email=user_data.email,
-            full_name=user_data.full_name,
-            role=user_data.role,
-            company_id=user_data.company_id,
-            can_add_devices=user_data.can_add_devices,
-            is_active=True
-        )
+    with _transaction(db, "Failed to create user"):
+        # Create new user with INSERT ... ON CONFLICT (email) DO NOTHING
+        # RETURNING: the created row comes back in the same round-trip, and a
+        # duplicate email returns no row instead of raising IntegrityError
+        new_user = db.execute(
+            pg_insert(User)
+            .values(
+                email=user_data.email,
+                full_name=user_data.full_name,
+                role=user_data.role,
+                company_id=user_data.company_id,
+                can_add_devices=user_data.can_add_devices,
+                is_active=True
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        ).scalar_one_or_none()
 
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        if new_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User with this email already exists"
+            )
 
-        logger.info(f"User created: {new_user.email} by {current_user.email}")
+    invalidate_company_stats(new_user.company_id)
 
-        return new_user
+    logger.info("User created: %s by %s", new_user.email, current_user.email)
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to create user: {e}")
+    return new_user
+
+
+@router.post(
+    "/bulk",
+    response_model=List[UserResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create multiple users"
+)
+def create_users_bulk(
+    users_data: List[UserCreate] = Body(..., min_length=1, max_length=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_super_admin())
+):
+    """
+    Create several users at once (Super Admin only).
+
+    All users are validated first and then inserted with a single
+    multi-row INSERT ... RETURNING, so the batch costs one round-trip
+    instead of one per user. Either every user is created or none is.
+
+    Args:
+        users_data: Users to create (1-100)
+        db: Database session
+        current_user: Current super admin user
+
+    Returns:
+        List[UserResponse]: Created users, in request order
+
+    Raises:
+        HTTPException 400: If an email is repeated or already exists,
+            or a company would exceed its user limit
+        HTTPException 403: If not a super admin
+        HTTPException 404: If a company is not found
+    """
+    emails = [user_data.email for user_data in users_data]
+    duplicates = sorted({email for email in emails if emails.count(email) > 1})
+    if duplicates:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create user"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate emails in request: {', '.join(duplicates)}"
         )
 
+    # Check every referenced company and its user limit in one query
+    requested = Counter(u.company_id for u in users_data if u.company_id)
+    if requested:
+        active_users = (
+            db.query(User.company_id, func.count(User.id).label("n"))
+            .filter(User.company_id.in_(requested), User.is_active == True)
+            .group_by(User.company_id)
+            .subquery()
+        )
+        limits = {
+            company_id: (max_users, active)
+            for company_id, max_users, active in db.query(
+                Company.id, Company.max_users, func.coalesce(active_users.c.n, 0)
+            )
+            .outerjoin(active_users, active_users.c.company_id == Company.id)
+            .filter(Company.id.in_(requested))
+        }
+
+        for company_id, new_users in requested.items():
+            if company_id not in limits:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Company not found: {company_id}"
+                )
+            max_users, active = limits[company_id]
+            if active + new_users > max_users:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Company {company_id} would exceed its maximum user limit ({max_users})"
+                )
+
+    with _transaction(db, "Failed to create users"):
+        # One executemany of INSERT ... ON CONFLICT (email) DO NOTHING
+        # RETURNING; emails that already exist come back without a row.
+        # Rows are not requested in parameter order: with ON CONFLICT,
+        # SQLAlchemy can only guarantee that by sending one INSERT per row,
+        # so they are put back in request order below instead
+        new_users = db.execute(
+            pg_insert(User)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User),
+            [
+                {
+                    "email": user_data.email,
+                    "full_name": user_data.full_name,
+                    "role": user_data.role,
+                    "company_id": user_data.company_id,
+                    "can_add_devices": user_data.can_add_devices,
+                    "is_active": True
+                }
+                for user_data in users_data
+            ]
+        ).scalars().all()
+
+        if len(new_users) < len(users_data):
+            existing = sorted(set(emails) - {user.email for user in new_users})
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Users with these emails already exist: {', '.join(existing)}"
+            )
+
+    position = {email: index for index, email in enumerate(emails)}
+    new_users.sort(key=lambda user: position[user.email])
+
+    for company_id in requested:
+        invalidate_company_stats(company_id)
+
+    logger.info("%s users created by %s", len(new_users), current_user.email)
+
+    return _users_response(new_users, status_code=status.HTTP_201_CREATED)
+
 
 # ============================================================
 # User Listing and Retrieval
@@ -139,12 +488,14 @@ async def create_user(
     response_model=List[UserResponse],
     summary="List users"
 )
-async def list_users(
+def list_users(
     company_id: Optional[uuid.UUID] = Query(None, description="Filter by company"),
     role: Optional[UserRole] = Query(None, description="Filter by role"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Number of records to skip (use cursor instead)"),
     limit: int = Query(100, ge=1, le=100),
+    include_total: bool = Query(False, description="Return the number of matching users in X-Total-Count"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
 ):
@@ -154,22 +505,38 @@ async def list_users(
     Super admins can list all users across all companies.
     Admins can only list users in their own company.
 
+    Users are returned oldest first. Pagination is keyset-based: when more
+    users exist, the cursor for the next page is returned in the
+    X-Next-Cursor response header and should be passed back as the
+    `cursor` query parameter.
+
+    With include_total, the number of users matching the filters is
+    returned in the X-Total-Count header, computed in the same query as
+    the page.
+
+    Rows are serialized with orjson directly from the selected columns,
+    without building ORM instances or Pydantic models.
+
     Args:
         company_id: Filter by company (super admin only)
         role: Filter by user role
         is_active: Filter by active status
-        skip: Pagination offset
+        cursor: Opaque cursor from the previous page
+        skip: Deprecated offset pagination, ignored when cursor is given
         limit: Maximum results
+        include_total: Whether to count all matching users
         db: Database session
         current_user: Current user
 
     Returns:
         List[UserResponse]: List of users
     """
-    query = db.query(User)
+    # Select just the UserResponse columns: rows are plain tuples, so no
+    # User instances, identity-map entries or relationship loads are created
+    query = db.query(*_USER_RESPONSE_COLUMNS)
 
     # Apply company filter based on role
-    if current_user.role == UserRole.SUPER_ADMIN:
+    if current_user.role is UserRole.SUPER_ADMIN:
         if company_id:
             query = query.filter(User.company_id == company_id)
     else:
@@ -182,11 +549,47 @@ async def list_users(
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
 
-    # Get users
-    users = query.offset(skip).limit(limit).all()
-
-    # Return users directly (FastAPI will serialize using UserResponse schema)
-    return users
+    # Count the whole filtered set in the same statement: the window
+    # function runs in an inner query, before the cursor and limit narrow
+    # the rows down to one page
+    page = User
+    if include_total:
+        filtered = query.add_columns(func.count().over().label("total")).subquery()
+        page = filtered.c
+        query = db.query(filtered)
+
+    # Seek past the previous page on the (created_at, id) index
+    query = query.order_by(page.created_at, page.id)
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        query = query.filter(tuple_(page.created_at, page.id) > (cursor_ts, cursor_id))
+    elif skip:
+        query = query.offset(skip)
+
+    # Stream rows in batches straight into dicts for orjson, fetching one
+    # extra row to detect whether another page follows. zip() stops at the
+    # UserResponse fields, dropping the trailing total column if present
+    result = []
+    last = None
+    has_more = False
+    for row in query.limit(limit + 1).yield_per(50):
+        if len(result) == limit:
+            has_more = True
+            continue
+
+        result.append(dict(zip(_USER_RESPONSE_FIELDS, row)))
+        last = row
+
+    headers = {}
+    if include_total:
+        # An empty page carries no total, so count separately in that case
+        total = last.total if last else db.query(func.count()).select_from(filtered).scalar()
+        headers[TOTAL_COUNT_HEADER] = str(total)
+
+    if has_more:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
+    return Response(content=orjson.dumps(result), media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -194,19 +597,22 @@ async def list_users(
     response_model=UserResponse,
     summary="Get current user profile"
 )
-async def get_my_profile(current_user: User = Depends(get_current_user)):
+async def get_my_profile(request: Request, current_user: User = Depends(get_current_user)):
     """
     Get current user's own profile.
 
     Returns detailed information about the authenticated user.
+    The response carries an ETag; a matching If-None-Match header gets
+    an empty 304 response.
 
     Args:
+        request: Incoming request
         current_user: Current authenticated user
 
     Returns:
         UserResponse: User profile information
     """
-    return current_user
+    return _profile_response(request, current_user)
 
 
 @router.get(
@@ -214,8 +620,9 @@ async def get_my_profile(current_user: User = Depends(get_current_user)):
     response_model=UserResponse,
     summary="Get user by ID"
 )
-async def get_user(
+def get_user(
     user_id: uuid.UUID,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -226,8 +633,14 @@ async def get_user(
     Admins can view users in their company.
     Users can only view their own profile.
 
+    Viewing your own profile is answered like /me, with an ETag. Other
+    users are served from a short-lived per-worker cache (see
+    app.utils.user_cache) that is dropped once a change to the user
+    commits.
+
     Args:
         user_id: User UUID
+        request: Incoming request
         db: Database session
         current_user: Current user
 
@@ -238,30 +651,44 @@ async def get_user(
         HTTPException 404: If user not found
         HTTPException 403: If no access permission
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    # Viewing your own profile needs no lookup
+    if user_id == current_user.id:
+        return _profile_response(request, current_user)
 
-    if not user:
+    # Enum members are singletons, so compare the role read once by identity
+    role = current_user.role
+
+    # Regular users may only view themselves: refuse before any lookup
+    if role is not UserRole.SUPER_ADMIN and role is not UserRole.ADMIN:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view your own profile"
         )
 
-    # Check access permissions
-    if current_user.role == UserRole.SUPER_ADMIN:
-        pass  # Can view anyone
-    elif current_user.role == UserRole.ADMIN:
-        if user.company_id != current_user.company_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have access to this user"
-            )
-    else:
-        if user.id != current_user.id:
+    # Serve other users from the lookup cache when possible
+    user = user_lookup_cache.get(user_id)
+    if user is None:
+        # Only columns are serialized; raiseload turns any relationship
+        # access slipping into UserResponse into an error, not a query
+        db_user = db.get(User, user_id, options=[raiseload("*")])
+
+        if not db_user:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You can only view your own profile"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
             )
 
+        user = UserResponse.model_validate(db_user)
+        user_lookup_cache.set(user_id, user)
+
+    # Admins can view users in their company; super admins can view anyone.
+    # The check runs on the cached response, which is shared by all viewers
+    if role is UserRole.ADMIN and user.company_id != current_user.company_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this user"
+        )
+
     return user
 
 
@@ -274,7 +701,7 @@ async def get_user(
     response_model=UserResponse,
     summary="Update own profile"
 )
-async def update_my_profile(
+def update_my_profile(
     user_data: UserUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -293,35 +720,28 @@ async def update_my_profile(
     Returns:
         UserResponse: Updated user profile
     """
-    try:
+    with _transaction(db, "Failed to update profile"):
         # Only allow updating certain fields
+        update_data = {}
         if user_data.full_name:
-            current_user.full_name = user_data.full_name
+            update_data["full_name"] = user_data.full_name
         if user_data.profile_picture_url:
-            current_user.profile_picture_url = user_data.profile_picture_url
+            update_data["profile_picture_url"] = user_data.profile_picture_url
 
-        db.commit()
-        db.refresh(current_user)
+        if update_data:
+            _update_user(db, current_user.id, **update_data)
 
-        logger.info(f"User updated own profile: {current_user.email}")
+        logger.info("User updated own profile: %s", current_user.email)
 
         return current_user
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to update user profile: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update profile"
-        )
-
 
 @router.put(
     "/{user_id}",
     response_model=UserResponse,
     summary="Update user (Admin only)"
 )
-async def update_user(
+def update_user(
     user_id: uuid.UUID,
     user_data: UserUpdate,
     db: Session = Depends(get_db),
@@ -346,42 +766,59 @@ async def update_user(
         HTTPException 404: If user not found
         HTTPException 403: If no permission to update
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    # Update allowed fields
+    update_data = {
+        field: value
+        for field, value in user_data.model_dump(exclude_unset=True).items()
+        if field not in ['role', 'company_id']  # Restrict sensitive fields
+    }
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    user = _manage_user(db, current_user, user_id, update_data, "update")
 
-    # Check if current user can manage this user
-    if not current_user.can_manage_user(user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this user"
-        )
+    logger.info("User updated: %s by %s", user.email, current_user.email)
 
-    try:
-        # Update allowed fields
-        update_data = user_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if field not in ['role', 'company_id']:  # Restrict sensitive fields
-                setattr(user, field, value)
+    return user
 
-        db.commit()
-        db.refresh(user)
 
-        logger.info(f"User updated: {user.email} by {current_user.email}")
+@router.patch(
+    "/{user_id}",
+    response_model=UserResponse,
+    summary="Update user status and permissions"
+)
+def patch_user(
+    user_id: uuid.UUID,
+    changes: UserStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin())
+):
+    """
+    Activate/deactivate a user and/or change their permissions (Admin only).
+
+    Only the fields present in the request body are written, in a single
+    UPDATE of just those columns.
 
-        return user
+    Args:
+        user_id: User UUID
+        changes: Status and permission changes
+        db: Database session
+        current_user: Current admin user
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to update user: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update user"
-        )
+    Returns:
+        UserResponse: Updated user details
+
+    Raises:
+        HTTPException 404: If user not found
+        HTTPException 403: If no permission to update
+    """
+    user = _manage_user(
+        db, current_user, user_id,
+        changes.model_dump(exclude_unset=True, exclude_none=True),
+        "update"
+    )
+
+    logger.info("User status updated: %s by %s", user.email, current_user.email)
+
+    return user
 
 
 @router.put(
@@ -389,7 +826,7 @@ async def update_user(
     response_model=UserResponse,
     summary="Update user permissions"
 )
-async def update_user_permissions(
+def update_user_permissions(
     user_id: uuid.UUID,
     permissions: UserPermissionsUpdate,
     db: Session = Depends(get_db),
@@ -414,38 +851,15 @@ async def update_user_permissions(
         HTTPException 404: If user not found
         HTTPException 403: If no permission
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _manage_user(
+        db, current_user, user_id,
+        {"can_add_devices": permissions.can_add_devices},
+        "update permissions of"
+    )
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
-    # Check management permission
-    if not current_user.can_manage_user(user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this user's permissions"
-        )
-
-    try:
-        user.can_add_devices = permissions.can_add_devices
-
-        db.commit()
-        db.refresh(user)
-
-        logger.info(f"User permissions updated: {user.email} by {current_user.email}")
-
-        return user
+    logger.info("User permissions updated: %s by %s", user.email, current_user.email)
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to update user permissions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update permissions"
-        )
+    return user
 
 
 # ============================================================
@@ -457,7 +871,7 @@ async def update_user_permissions(
     response_model=UserResponse,
     summary="Deactivate user"
 )
-async def deactivate_user(
+def deactivate_user(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -475,37 +889,11 @@ async def deactivate_user(
     Returns:
         UserResponse: Deactivated user details
     """
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    user = _manage_user(db, current_user, user_id, {"is_active": False}, "deactivate")
 
-    if not current_user.can_manage_user(user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to deactivate this user"
-        )
+    logger.info("User deactivated: %s by %s", user.email, current_user.email)
 
-    try:
-        user.is_active = False
-
-        db.commit()
-        db.refresh(user)
-
-        logger.info(f"User deactivated: {user.email} by {current_user.email}")
-
-        return user
-
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to deactivate user: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to deactivate user"
-        )
+    return user
 
 
 @router.post(
@@ -513,7 +901,7 @@ async def deactivate_user(
     response_model=UserResponse,
     summary="Activate user"
 )
-async def activate_user(
+def activate_user(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -529,37 +917,88 @@ async def activate_user(
     Returns:
         UserResponse: Activated user details
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _manage_user(db, current_user, user_id, {"is_active": True}, "activate")
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
+    logger.info("User activated: %s by %s", user.email, current_user.email)
 
-    if not current_user.can_manage_user(user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to activate this user"
-        )
+    return user
 
-    try:
-        user.is_active = True
 
-        db.commit()
-        db.refresh(user)
+@router.post(
+    "/bulk-deactivate",
+    response_model=List[UserResponse],
+    summary="Deactivate multiple users"
+)
+def bulk_deactivate_users(
+    user_ids: List[uuid.UUID] = Body(..., min_length=1, max_length=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin())
+):
+    """
+    Deactivate several users at once (Admin only).
 
-        logger.info(f"User activated: {user.email} by {current_user.email}")
+    All users are deactivated with a single UPDATE ... WHERE id = ANY(...)
+    that also carries the management rules, instead of one request and
+    statement per user. Either every listed user is deactivated or none is;
+    users that are already inactive are returned without being rewritten.
 
-        return user
+    Args:
+        user_ids: UUIDs of the users to deactivate (1-1000)
+        db: Database session
+        current_user: Current admin user
 
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to activate user: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to activate user"
-        )
+    Returns:
+        List[UserResponse]: Deactivated users
+
+    Raises:
+        HTTPException 404: If a user is not found
+        HTTPException 403: If current_user cannot manage one of the users
+    """
+    requested = set(user_ids)
+    can_manage = current_user.manageable_users_clause()
+    unchanged = []
+
+    with _transaction(db, "Failed to deactivate users"):
+        users = db.execute(
+            update(User)
+            .where(User.id.in_(requested), can_manage, User.is_active.is_(True))
+            .values(is_active=False)
+            .returning(User)
+        ).scalars().all()
+
+        unmatched = requested - {user.id for user in users}
+        if unmatched:
+            # Manageable users the UPDATE skipped were already inactive
+            unchanged = db.scalars(
+                select(User)
+                .options(raiseload("*"))
+                .where(User.id.in_(unmatched), can_manage)
+            ).all()
+            unmatched -= {user.id for user in unchanged}
+
+        if unmatched:
+            missing = unmatched - set(db.scalars(select(User.id).where(User.id.in_(unmatched))))
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Users not found: {', '.join(sorted(str(user_id) for user_id in missing))}"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to deactivate some of these users"
+            )
+
+    # Core UPDATE does not fire mapper events, so invalidate here (after
+    # the commit, so no concurrent lookup can re-cache the old rows)
+    for user in users:
+        forget_user_lookup(user.id)
+        forget_cached_user(user.id)
+    for company_id in {user.company_id for user in users}:
+        invalidate_company_stats(company_id)
+
+    logger.info("%s users deactivated by %s", len(users), current_user.email)
+
+    return _users_response(users + unchanged)
 
 
 @router.delete(
@@ -567,7 +1006,7 @@ async def activate_user(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete user"
 )
-async def delete_user(
+def delete_user(
     user_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin())
@@ -587,32 +1026,30 @@ async def delete_user(
         HTTPException 404: If user not found
         HTTPException 403: If no permission
     """
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-
-    if not current_user.can_manage_user(user):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this user"
-        )
-
-    try:
-        db.delete(user)
-        db.commit()
-
-        logger.warning(f"User deleted: {user.email} by {current_user.email}")
-
-        return None
-
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Failed to delete user: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete user"
-        )
+    with _transaction(db, "Failed to delete user"):
+        # Core DELETEs skip loading the user and their children one by one.
+        # Devices go with the user through ON DELETE CASCADE; sent
+        # invitations and audit logs are deleted explicitly, as the ORM
+        # cascade did before. The management rules are part of the user
+        # DELETE's WHERE clause, and everything is rolled back if it
+        # matches nothing
+        db.execute(delete(Invitation).where(Invitation.invited_by == user_id))
+        db.execute(delete(AuditLog).where(AuditLog.user_id == user_id))
+        user = db.execute(
+            delete(User)
+            .where(User.id == user_id, current_user.manageable_users_clause())
+            .returning(User.email, User.company_id)
+        ).first()
+
+        if user is None:
+            _raise_not_manageable(db, user_id, "delete")
+
+    # Core statements bypass the mapper listeners, so invalidate here
+    # (after the commit)
+    forget_user_lookup(user_id)
+    forget_cached_user(user_id)
+    invalidate_company_stats(user.company_id)
+
+    logger.warning("User deleted: %s by %s", user.email, current_user.email)
+
+    return None
@@ -8,24 +8,27 @@ Schemas for authentication-related API operations including:
 - Google OAuth authentication
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 import uuid
 
+from app.utils.validators import Email
+
 
 class LoginRequest(BaseModel):
     """Schema for login request (email/password or Google OAuth code)."""
 
-    email: Optional[EmailStr] = Field(None, description="Email for password login")
+    email: Optional[Email] = Field(None, description="Email for password login")
     password: Optional[str] = Field(None, description="Password for email login")
     google_auth_code: Optional[str] = Field(None, description="Google OAuth authorization code")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "google_auth_code": "4/0AX4XfWh..."
             }
         }
+    )
 
 
 class GoogleAuthRequest(BaseModel):
@@ -44,8 +47,8 @@ class TokenResponse(BaseModel):
     expires_in: int = Field(..., description="Token expiration time in seconds")
     user: dict = Field(..., description="User information")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -59,6 +62,7 @@ class TokenResponse(BaseModel):
                 }
             }
         }
+    )
 
 
 class RefreshTokenRequest(BaseModel):
@@ -75,9 +79,10 @@ class GoogleAuthURL(BaseModel):
         description="Google OAuth authorization URL to redirect user to"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "auth_url": "https://accounts.google.com/o/oauth2/auth?client_id=..."
             }
         }
+    )
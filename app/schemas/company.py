@@ -5,11 +5,13 @@ Company Pydantic Schemas
 Schemas for Company-related API operations.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
+from app.utils.validators import validate_subdomain
+
 
 class CompanyCreate(BaseModel):
     """Schema for creating a new company."""
@@ -20,15 +22,10 @@ class CompanyCreate(BaseModel):
     max_users: int = Field(default=10, ge=1, description="Maximum users allowed")
     max_devices: int = Field(default=5, ge=1, description="Maximum devices allowed")
 
-    @validator('subdomain')
-    def validate_subdomain(cls, v):
-        """Validate subdomain format (alphanumeric and hyphens only)."""
-        if v and not v.replace('-', '').isalnum():
-            raise ValueError("Subdomain must contain only letters, numbers, and hyphens")
-        return v.lower() if v else None
+    _validate_subdomain = field_validator('subdomain')(validate_subdomain)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Acme Corporation",
                 "subdomain": "acme",
@@ -36,6 +33,7 @@ class CompanyCreate(BaseModel):
                 "max_devices": 100
             }
         }
+    )
 
 
 class CompanyUpdate(BaseModel):
@@ -48,12 +46,7 @@ class CompanyUpdate(BaseModel):
     max_devices: Optional[int] = Field(None, ge=1)
     is_active: Optional[bool] = None
 
-    @validator('subdomain')
-    def validate_subdomain(cls, v):
-        """Validate subdomain format (alphanumeric and hyphens only)."""
-        if v and not v.replace('-', '').isalnum():
-            raise ValueError("Subdomain must contain only letters, numbers, and hyphens")
-        return v.lower() if v else None
+    _validate_subdomain = field_validator('subdomain')(validate_subdomain)
 
 
 class CompanyResponse(BaseModel):
@@ -69,8 +62,7 @@ class CompanyResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CompanyListResponse(BaseModel):
@@ -85,8 +77,8 @@ class CompanyListResponse(BaseModel):
     max_devices: int
     current_users: int
     current_devices: int
-    created_at: Optional[str]
-    updated_at: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
 
 
 class CompanyStatsResponse(BaseModel):
@@ -97,8 +89,8 @@ class CompanyStatsResponse(BaseModel):
     users: dict
     devices: dict
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "company_id": "550e8400-e29b-41d4-a716-446655440000",
                 "company_name": "Acme Corporation",
@@ -118,3 +110,4 @@ class CompanyStatsResponse(BaseModel):
                 }
             }
         }
+    )
@@ -5,27 +5,30 @@ Invitation Pydantic Schemas
 Schemas for Invitation-related API operations.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 import uuid
 
+from app.utils.validators import Email
+
 
 class InvitationCreate(BaseModel):
     """Schema for creating a new invitation."""
 
-    email: EmailStr = Field(..., description="Invitee's email address")
+    email: Email = Field(..., description="Invitee's email address")
     role: str = Field(..., description="Role to assign (admin or user)")
     company_id: uuid.UUID = Field(..., description="Company to invite user to")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "newuser@example.com",
                 "role": "user",
                 "company_id": "123e4567-e89b-12d3-a456-426614174000"
             }
         }
+    )
 
 
 class InvitationAccept(BaseModel):
@@ -34,13 +37,14 @@ class InvitationAccept(BaseModel):
     token: str = Field(..., description="Invitation token from email")
     full_name: str = Field(..., min_length=2, max_length=255, description="User's full name")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "token": "abc123xyz789",
                 "full_name": "John Doe"
             }
         }
+    )
 
 
 class InvitationResponse(BaseModel):
@@ -54,5 +58,4 @@ class InvitationResponse(BaseModel):
     expires_at: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -16,12 +16,13 @@ All schemas include validation rules and are used by FastAPI for:
 - API documentation
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 import uuid
 
 from app.models.user import UserRole
+from app.utils.validators import Email
 
 
 # ============================================================
@@ -52,10 +53,10 @@ class UserCreate(BaseModel):
         }
     """
 
-    email: EmailStr = Field(
+    email: Email = Field(
         ...,
         description="User's email address",
-        example="user@example.com"
+        examples=["user@example.com"]
     )
 
     full_name: str = Field(
@@ -63,28 +64,29 @@ class UserCreate(BaseModel):
         min_length=2,
         max_length=255,
         description="User's full name",
-        example="John Doe"
+        examples=["John Doe"]
     )
 
     role: UserRole = Field(
         default=UserRole.USER,
         description="User role (admin or user)",
-        example="user"
+        examples=["user"]
     )
 
     company_id: Optional[uuid.UUID] = Field(
         None,
         description="Company ID (required for admins and users)",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
 
     can_add_devices: bool = Field(
         default=False,
         description="Whether user can add new devices",
-        example=True
+        examples=[True]
     )
 
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         """
         Validate that role is not super_admin.
@@ -96,9 +98,8 @@ class UserCreate(BaseModel):
             raise ValueError("Cannot create super admin users through API")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "john.doe@example.com",
                 "full_name": "John Doe",
@@ -107,6 +108,7 @@ class UserCreate(BaseModel):
                 "can_add_devices": True
             }
         }
+    )
 
 
 # ============================================================
@@ -139,49 +141,50 @@ class UserUpdate(BaseModel):
         min_length=2,
         max_length=255,
         description="User's full name",
-        example="John Smith"
+        examples=["John Smith"]
     )
 
     profile_picture_url: Optional[str] = Field(
         None,
         description="Profile picture URL",
-        example="https://example.com/photo.jpg"
+        examples=["https://example.com/photo.jpg"]
     )
 
     role: Optional[UserRole] = Field(
         None,
         description="User role (admin or user)",
-        example="admin"
+        examples=["admin"]
     )
 
     can_add_devices: Optional[bool] = Field(
         None,
         description="Whether user can add new devices",
-        example=True
+        examples=[True]
     )
 
     is_active: Optional[bool] = Field(
         None,
         description="Account status",
-        example=True
+        examples=[True]
     )
 
-    @validator('role')
+    @field_validator('role')
+    @classmethod
     def validate_role(cls, v):
         """Validate that role is not super_admin."""
         if v == UserRole.SUPER_ADMIN:
             raise ValueError("Cannot change role to super_admin")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "full_name": "John Smith",
                 "can_add_devices": True,
                 "is_active": True
             }
         }
+    )
 
 
 class UserPermissionsUpdate(BaseModel):
@@ -203,16 +206,55 @@ class UserPermissionsUpdate(BaseModel):
     can_add_devices: bool = Field(
         ...,
         description="Whether user can add new devices",
-        example=True
+        examples=[True]
     )
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "can_add_devices": True
             }
         }
+    )
+
+
+class UserStatusUpdate(BaseModel):
+    """
+    Schema for changing a user's status and permissions in one request.
+
+    Used by admins with PATCH /users/{id}. Only the fields present in the
+    request body are updated.
+
+    Fields:
+        is_active: Account status (optional)
+        can_add_devices: Whether user can add new devices (optional)
+
+    Example Request Body:
+        {
+            "is_active": false
+        }
+    """
+
+    is_active: Optional[bool] = Field(
+        None,
+        description="Account status",
+        examples=[False]
+    )
+
+    can_add_devices: Optional[bool] = Field(
+        None,
+        description="Whether user can add new devices",
+        examples=[True]
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "is_active": False,
+                "can_add_devices": True
+            }
+        }
+    )
 
 
 # ============================================================
@@ -267,10 +309,9 @@ class UserResponse(BaseModel):
     updated_at: datetime = Field(..., description="Last update timestamp")
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
 
-    class Config:
-        """Pydantic configuration."""
-        from_attributes = True  # Enable ORM mode for SQLAlchemy models (Pydantic v2)
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,  # Enable ORM mode for SQLAlchemy models (Pydantic v2)
+        json_schema_extra={
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "email": "john.doe@example.com",
@@ -286,6 +327,7 @@ class UserResponse(BaseModel):
                 "last_login": "2024-01-20T14:25:00Z"
             }
         }
+    )
 
 
 # ============================================================
@@ -315,14 +357,13 @@ class UserListResponse(BaseModel):
         }
     """
 
-    total: int = Field(..., description="Total number of users", example=45)
-    page: int = Field(..., description="Current page number", example=1)
-    page_size: int = Field(..., description="Users per page", example=20)
+    total: int = Field(..., description="Total number of users", examples=[45])
+    page: int = Field(..., description="Current page number", examples=[1])
+    page_size: int = Field(..., description="Users per page", examples=[20])
     users: List[UserResponse] = Field(..., description="List of users")
 
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total": 45,
                 "page": 1,
@@ -342,3 +383,4 @@ class UserListResponse(BaseModel):
                 ]
             }
         }
+    )
@@ -14,7 +14,14 @@ Available utilities:
 All utilities are designed to be reusable and stateless.
 """
 
-from app.utils.encryption import encrypt_data, decrypt_data
+from app.utils.encryption import (
+    encrypt_data,
+    decrypt_data,
+    encrypt_bytes,
+    decrypt_data_bytes,
+    encrypt_batch,
+    decrypt_batch
+)
 from app.utils.auth import (
     create_access_token,
     create_refresh_token,
@@ -26,6 +33,10 @@ from app.utils.auth import (
 __all__ = [
     "encrypt_data",
     "decrypt_data",
+    "encrypt_bytes",
+    "decrypt_data_bytes",
+    "encrypt_batch",
+    "decrypt_batch",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
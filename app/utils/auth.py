@@ -33,15 +33,22 @@ Security Features:
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from jose import JWTError, jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+import hashlib
+import re
+import time
 import uuid
 import logging
 
 from app.config import settings
 from app.database import get_db
 from app.models.user import User, UserRole
+from app.utils.cache import TTLCache
 
 # ============================================================
 # Logger Configuration
@@ -58,6 +65,51 @@ logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+# ============================================================
+# Token Lifetimes
+# ============================================================
+
+# Settings are fixed at startup, so lifetimes are computed once
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_EXPIRE = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+
+# ============================================================
+# Authentication Errors
+# ============================================================
+
+# Arguments of the fixed 401 errors, built once instead of on every request.
+# Each failure raises a fresh HTTPException(**...) from None: a shared
+# exception instance would carry the traceback, __context__ and __cause__
+# of whichever request raised it last into other concurrent requests.
+_CREDENTIALS_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Could not validate credentials",
+    "headers": {"WWW-Authenticate": "Bearer"},
+}
+_INVALID_USER_ID_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Invalid user ID in token"
+}
+_INVALID_REFRESH_TOKEN_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "Invalid refresh token"
+}
+_USER_NOT_FOUND_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "User not found"
+}
+_USER_INACTIVE_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "User account is inactive"
+}
+_USER_NOT_FOUND_OR_INACTIVE_ERROR = {
+    "status_code": status.HTTP_401_UNAUTHORIZED,
+    "detail": "User not found or inactive"
+}
+
+
 # ============================================================
 # Token Creation Functions
 # ============================================================
@@ -88,8 +140,7 @@ def create_access_token(user_id: uuid.UUID, email: str, role: str,
         >>> )
         >>> # Client includes in requests: Authorization: Bearer <token>
     """
-    expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    expire = datetime.utcnow() + expires_delta
+    expire = datetime.utcnow() + _ACCESS_TOKEN_EXPIRE
 
     # Token payload
     payload = {
@@ -133,8 +184,7 @@ def create_refresh_token(user_id: uuid.UUID, email: str) -> str:
         >>> )
         >>> # Client stores securely and uses to refresh access token
     """
-    expires_delta = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    expire = datetime.utcnow() + expires_delta
+    expire = datetime.utcnow() + _REFRESH_TOKEN_EXPIRE
 
     # Token payload (minimal for refresh tokens)
     payload = {
@@ -155,6 +205,91 @@ def create_refresh_token(user_id: uuid.UUID, email: str) -> str:
     return encoded_jwt
 
 
+# ============================================================
+# Verified Token Cache
+# ============================================================
+
+# Clients send the same token on every request until it expires, so the
+# payload of each verified token is memoized under a hash of the token (raw
+# tokens are never stored). Hits re-check the exp claim, so an expired
+# token is never accepted from the cache. Tokens that failed verification
+# are remembered briefly, so replaying a bad token skips the signature check.
+_token_cache = TTLCache(
+    ttl_seconds=_ACCESS_TOKEN_EXPIRE_SECONDS,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES
+)
+_rejected_token_cache = TTLCache(
+    ttl_seconds=settings.REJECTED_TOKEN_CACHE_TTL_SECONDS,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES
+)
+
+
+def _token_key(token: str) -> bytes:
+    """
+    Derive the cache key of a token.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the token
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def forget_cached_token(token: str) -> None:
+    """
+    Drop a token from the verified token cache.
+
+    The token itself stays valid until it expires (there is no denylist);
+    this only releases the cache entry of a token the client discards.
+
+    Args:
+        token: JWT token string
+    """
+    _token_cache.delete(_token_key(token))
+
+
+def _decode_token(token: str) -> Optional[dict]:
+    """
+    Decode and verify a JWT, using the verified token cache.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        dict: Decoded payload, or None if the token is invalid or expired
+    """
+    key = _token_key(token)
+
+    payload = _token_cache.get(key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        _token_cache.delete(key)
+        return None
+
+    if _rejected_token_cache.get(key):
+        return None
+
+    try:
+        # Decode and verify token (signature and expiration)
+        payload = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM]
+        )
+    except JWTError as e:
+        logger.error("JWT verification failed: %s", e)
+        _rejected_token_cache.set(key, True)
+        return None
+
+    # Only tokens that expire are cached, so a hit can always re-check exp
+    if "exp" in payload:
+        _token_cache.set(key, payload)
+    return payload
+
+
 # ============================================================
 # Token Validation Functions
 # ============================================================
@@ -169,6 +304,9 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
     3. Checks expiration
     4. Validates token type
 
+    Steps 1-3 are skipped for a token already verified by this worker
+    (see _token_cache); its expiration is still checked.
+
     Args:
         token: JWT token string
         expected_type: Expected token type ("access" or "refresh")
@@ -187,36 +325,155 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
         >>>     # Token invalid
         >>>     pass
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    payload = _decode_token(token)
+    if payload is None:
+        raise HTTPException(**_CREDENTIALS_ERROR) from None
 
-    try:
-        # Decode and verify token
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
+    # Verify token type
+    token_type = payload.get("type")
+    if token_type != expected_type:
+        logger.warning("Invalid token type: expected %s, got %s", expected_type, token_type)
+        raise HTTPException(**_CREDENTIALS_ERROR) from None
 
-        # Verify token type
-        token_type = payload.get("type")
-        if token_type != expected_type:
-            logger.warning(f"Invalid token type: expected {expected_type}, got {token_type}")
-            raise credentials_exception
+    # Get user ID from token
+    user_id = payload.get("sub")
+    if user_id is None:
+        raise HTTPException(**_CREDENTIALS_ERROR) from None
 
-        # Get user ID from token
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
+    return payload
 
-        return payload
 
-    except JWTError as e:
-        logger.error(f"JWT verification failed: {e}")
-        raise credentials_exception
+# ============================================================
+# Authenticated User Cache
+# ============================================================
+
+# Every authenticated request resolves its user, so the user row is memoized
+# per id for a short TTL. Column values are cached (not instances), and each
+# request gets its own session-bound User built from them. Entries are
+# dropped once an update or delete of the user commits in this worker
+# (see app.utils.user_cache); the TTL bounds how long other workers may
+# still see the old role/status.
+# Keys are the canonical id strings from the token "sub" claim, so the
+# hot path never builds a uuid.UUID.
+_auth_user_cache = TTLCache(
+    ttl_seconds=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES
+)
+
+_USER_COLUMN_KEYS = [attr.key for attr in inspect(User).column_attrs]
+
+# Column-only SELECT built once at import: a cache miss fetches a plain row
+# (no entity hydration or identity-map bookkeeping) and goes through the
+# same attach path as a cache hit. Only active users are cached, so a
+# cached entry is always an active user (updates in this worker evict it).
+_USER_BY_ID = select(
+    *(getattr(User, key) for key in _USER_COLUMN_KEYS)
+).where(User.id == bindparam("user_id"))
+
+# Canonical form of str(uuid.UUID), the only form create_access_token and
+# create_refresh_token write into "sub". Checking it is much cheaper than
+# parsing with uuid.UUID, and Postgres casts the string to UUID on bind.
+_USER_ID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
+
+def _valid_user_id(user_id_str) -> bool:
+    """
+    Check that a token subject is a user id in canonical UUID form.
+
+    Args:
+        user_id_str: The "sub" claim from a verified token
+
+    Returns:
+        bool: True if it can be used as a user id
+    """
+    return isinstance(user_id_str, str) and _USER_ID_PATTERN.fullmatch(user_id_str) is not None
+
+
+def forget_cached_user(user_id: uuid.UUID) -> None:
+    """
+    Drop a user from the authenticated user cache.
+
+    Flushed User updates/deletes are evicted after commit by
+    app.utils.user_cache; call this after committing Core UPDATE/DELETE
+    statements that change users.
+
+    Args:
+        user_id: User UUID
+    """
+    _auth_user_cache.delete(str(user_id))
+
+
+def forget_all_cached_users() -> None:
+    """
+    Empty the authenticated user cache.
+
+    For bulk changes that affect many users at once (e.g. deactivating or
+    deleting a company), where listing the affected ids is not worth it.
+    """
+    _auth_user_cache.clear()
+
+
+
+def _attach_user(db: Session, values: dict) -> User:
+    """
+    Attach a user built from cached column values to a session.
+
+    Args:
+        db: Database session
+        values: Column values keyed by attribute name
+
+    Returns:
+        User: Persistent user in db (no SELECT is emitted)
+    """
+    # Rebuild a clean, detached instance and attach it without a SELECT
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _cached_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    Get a user for authentication from the cache, without any I/O.
+
+    Args:
+        db: Database session
+        user_id: User id in canonical UUID string form
+
+    Returns:
+        User: User attached to db, or None if not cached
+    """
+    values = _auth_user_cache.get(user_id)
+    if values is None:
+        return None
+    return _attach_user(db, values)
+
+
+def _load_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    Load a user for authentication from the database.
+
+    Active users are cached; inactive ones are returned (so callers can
+    tell them apart from missing users) but not cached.
+
+    Blocking: call through run_in_threadpool from async code.
+
+    Args:
+        db: Database session
+        user_id: User id in canonical UUID string form
+
+    Returns:
+        User: User attached to db, or None if not found
+    """
+    row = db.execute(_USER_BY_ID, {"user_id": user_id}).first()
+    if row is None:
+        return None
+
+    values = dict(zip(_USER_COLUMN_KEYS, row))
+    if values["is_active"]:
+        _auth_user_cache.set(user_id, values)
+    return _attach_user(db, values)
 
 
 # ============================================================
@@ -224,6 +481,7 @@ def verify_token(token: str, expected_type: str = "access") -> dict:
 # ============================================================
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -233,7 +491,18 @@ async def get_current_user(
     This function is used as a FastAPI dependency to extract
     and validate the current user from the request token.
 
+    This is async so the common path - token and user both cached by this
+    worker - runs on the event loop with no threadpool hop. Only a cache
+    miss queries the database, explicitly through run_in_threadpool.
+
+    The resolved user is stored on request.state.current_user, so any
+    further resolution within the same request (role checks, company
+    access checks, nested dependencies) reuses it instead of querying
+    the users table again. Across requests, the user row is served from a
+    short-lived per-worker cache (AUTH_USER_CACHE_TTL_SECONDS).
+
     Args:
+        request: Incoming request (used for per-request caching)
         token: JWT token from Authorization header
         db: Database session
 
@@ -241,7 +510,7 @@ async def get_current_user(
         User: Current authenticated user object
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid or user not found or inactive
 
     Example:
         >>> from fastapi import Depends
@@ -251,34 +520,31 @@ async def get_current_user(
         >>> async def get_profile(current_user: User = Depends(get_current_user)):
         >>>     return {"email": current_user.email, "name": current_user.full_name}
     """
+    # Reuse the user already resolved for this request
+    cached_user = getattr(request.state, "current_user", None)
+    if cached_user is not None:
+        return cached_user
+
     # Verify token and get payload
     payload = verify_token(token, "access")
 
-    # Extract user ID from payload
-    user_id_str = payload.get("sub")
-    try:
-        user_id = uuid.UUID(user_id_str)
-    except (ValueError, AttributeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid user ID in token"
-        )
+    # Extract user ID from payload (kept as a string; see _USER_ID_PATTERN)
+    user_id = payload.get("sub")
+    if not _valid_user_id(user_id):
+        raise HTTPException(**_INVALID_USER_ID_ERROR) from None
 
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from the per-worker cache or the database
+    user = _cached_user(db, user_id)
+    if user is None:
+        user = await run_in_threadpool(_load_user, db, user_id)
 
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        raise HTTPException(**_USER_NOT_FOUND_ERROR) from None
 
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User account is inactive"
-        )
+        raise HTTPException(**_USER_INACTIVE_ERROR) from None
 
+    request.state.current_user = user
     return user
 
 
@@ -316,6 +582,10 @@ def require_role(allowed_roles: list[UserRole]):
     Creates a dependency that checks if the current user has one of
     the allowed roles. Use this to restrict endpoints to specific roles.
 
+    Calls with the same roles (in the same order) return the same
+    dependency callable, so FastAPI resolves it once per request even
+    when several dependencies require it.
+
     Args:
         allowed_roles: List of allowed UserRole values
 
@@ -342,6 +612,29 @@ def require_role(allowed_roles: list[UserRole]):
         >>>     # Only admins and super admins reach here
         >>>     pass
     """
+    return _role_checker(tuple(allowed_roles))
+
+
+@lru_cache(maxsize=32)
+def _role_checker(allowed_roles: tuple[UserRole, ...]):
+    """
+    Build the role checking dependency for a combination of roles.
+
+    Memoized, so each combination gets a single shared callable.
+
+    Args:
+        allowed_roles: Allowed UserRole values
+
+    Returns:
+        Function: Dependency function for FastAPI
+    """
+    # Resolved once per role combination, not on every request
+    allowed = frozenset(allowed_roles)
+    forbidden_error = {
+        "status_code": status.HTTP_403_FORBIDDEN,
+        "detail": f"Insufficient permissions. Required role: {[r.value for r in allowed_roles]}"
+    }
+
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
         """
         Check if current user has required role.
@@ -355,21 +648,26 @@ def require_role(allowed_roles: list[UserRole]):
         Raises:
             HTTPException: If user doesn't have required role
         """
-        if current_user.role not in allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions. Required role: {[r.value for r in allowed_roles]}"
-            )
+        if current_user.role not in allowed:
+            # Fresh instance per request; see Authentication Errors
+            raise HTTPException(**forbidden_error) from None
         return current_user
 
     return role_checker
 
 
+# Shared role checkers (FastAPI caches dependencies per request by
+# callable identity)
+_super_admin_checker = require_role([UserRole.SUPER_ADMIN])
+_admin_checker = require_role([UserRole.SUPER_ADMIN, UserRole.ADMIN])
+
+
 def require_super_admin():
     """
     Dependency that requires super admin role.
 
     Convenience function for endpoints that only super admins can access.
+    Always returns the same shared dependency callable.
 
     Returns:
         Function: Dependency function for FastAPI
@@ -383,13 +681,15 @@ def require_super_admin():
         >>>     # Only super admins can delete companies
         >>>     pass
     """
-    return require_role([UserRole.SUPER_ADMIN])
+    return _super_admin_checker
 
 
 def require_admin():
     """
     Dependency that requires admin or super admin role.
 
+    Always returns the same shared dependency callable.
+
     Returns:
         Function: Dependency function for FastAPI
 
@@ -402,7 +702,7 @@ def require_admin():
         >>>     # Only admins and super admins can create users
         >>>     pass
     """
-    return require_role([UserRole.SUPER_ADMIN, UserRole.ADMIN])
+    return _admin_checker
 
 
 # ============================================================
@@ -455,13 +755,17 @@ def require_company_access(company_id: uuid.UUID):
         >>>     # User has access to this company
         >>>     pass
     """
+    access_denied_error = {
+        "status_code": status.HTTP_403_FORBIDDEN,
+        "detail": "You don't have access to this company's data"
+    }
+
     async def company_access_checker(current_user: User = Depends(get_current_user)) -> User:
         """Check if user has access to the company."""
-        if not check_company_access(current_user, company_id):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have access to this company's data"
-            )
+        # Same rule as check_company_access, inlined; the user's role is
+        # always a UserRole member here, so an identity check suffices
+        if current_user.role is not UserRole.SUPER_ADMIN and current_user.company_id != company_id:
+            raise HTTPException(**access_denied_error) from None
         return current_user
 
     return company_access_checker
@@ -501,12 +805,16 @@ def create_token_response(user: User) -> dict:
             }
         }
     """
+    # Read each column once; role is a UserRole enum on loaded users
+    role = user.role.value if isinstance(user.role, UserRole) else user.role
+    company_id = user.company_id
+
     # Create tokens
     access_token = create_access_token(
         user_id=user.id,
         email=user.email,
-        role=user.role.value if hasattr(user.role, 'value') else user.role,
-        company_id=user.company_id
+        role=role,
+        company_id=company_id
     )
 
     refresh_token = create_refresh_token(
@@ -519,13 +827,13 @@ def create_token_response(user: User) -> dict:
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token_type": "bearer",
-        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # In seconds
+        "expires_in": _ACCESS_TOKEN_EXPIRE_SECONDS,
         "user": {
             "id": str(user.id),
             "email": user.email,
             "full_name": user.full_name,
-            "role": user.role.value if hasattr(user.role, 'value') else user.role,
-            "company_id": str(user.company_id) if user.company_id else None,
+            "role": role,
+            "company_id": str(company_id) if company_id else None,
             "can_add_devices": user.can_add_devices
         }
     }
@@ -535,7 +843,7 @@ def create_token_response(user: User) -> dict:
 # Token Refresh
 # ============================================================
 
-async def refresh_access_token(
+def refresh_access_token(
     refresh_token: str,
     db: Session
 ) -> dict:
@@ -554,32 +862,26 @@ async def refresh_access_token(
 
     Example:
         >>> @app.post("/auth/refresh")
-        >>> async def refresh_token(
+        >>> def refresh_token(
         >>>     refresh_token: str,
         >>>     db: Session = Depends(get_db)
         >>> ):
-        >>>     return await refresh_access_token(refresh_token, db)
+        >>>     return refresh_access_token(refresh_token, db)
     """
     # Verify refresh token
     payload = verify_token(refresh_token, "refresh")
 
     # Get user from database
     user_id_str = payload.get("sub")
-    try:
-        user_id = uuid.UUID(user_id_str)
-    except (ValueError, AttributeError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token"
-        )
+    if not _valid_user_id(user_id_str):
+        raise HTTPException(**_INVALID_REFRESH_TOKEN_ERROR) from None
 
-    user = db.query(User).filter(User.id == user_id).first()
+    # Same active-user lookup as get_current_user; it also warms the
+    # authenticated user cache for the new access token
+    user = _load_user(db, user_id_str)
 
-    if not user or not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive"
-        )
+    if user is None or not user.is_active:
+        raise HTTPException(**_USER_NOT_FOUND_OR_INACTIVE_ERROR) from None
 
     # Create new token response
     return create_token_response(user)
@@ -0,0 +1,108 @@
+"""
+Caching Utilities
+=================
+
+This module provides a small in-process cache with per-entry expiry.
+
+It is intended for short-lived memoization of values that are expensive to
+compute but tolerate a few seconds of staleness, such as dashboard
+statistics. Entries are also removed explicitly when the underlying data
+changes, so the TTL only bounds staleness across worker processes.
+
+Note:
+- The cache is local to each worker process (not shared between workers)
+- All operations are thread-safe
+
+Usage:
+    from app.utils.cache import TTLCache
+
+    stats_cache = TTLCache(ttl_seconds=30)
+
+    value = stats_cache.get(key)
+    if value is None:
+        value = compute()
+        stats_cache.set(key, value)
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Thread-safe in-process cache with time-based expiry.
+
+    Attributes:
+        ttl_seconds: Lifetime of each entry in seconds
+        max_entries: Maximum number of entries kept (oldest evicted first)
+
+    Example:
+        >>> cache = TTLCache(ttl_seconds=30)
+        >>> cache.set("stats:123", {"total": 5})
+        >>> cache.get("stats:123")
+        {'total': 5}
+        >>> cache.delete("stats:123")
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Lifetime of each entry in seconds
+            max_entries: Maximum number of entries kept
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order, so the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a value from the cache (no-op if missing).
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        with self._lock:
+            self._entries.clear()
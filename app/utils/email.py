@@ -17,15 +17,21 @@ Email Templates:
 - Account notifications
 - System alerts
 
-All emails are sent asynchronously to avoid blocking API requests.
+All emails are sent asynchronously to avoid blocking API requests:
+the send_*_email functions only build the message and queue it, and a
+background worker thread (started in the application lifespan) delivers
+it over SMTP.
 """
 
+import queue
 import smtplib
+import threading
+from string import Template
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, List
+from typing import Optional, List, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.config import settings
 
@@ -35,10 +41,104 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+# ============================================================
+# SMTP Connection
+# ============================================================
+
+# One SMTP connection is kept open per worker and reused for every email,
+# so the TCP connect, STARTTLS and LOGIN handshakes happen once instead of
+# on every send. The lock serializes sends over the shared connection.
+_smtp: Optional[smtplib.SMTP] = None
+_smtp_lock = threading.Lock()
+
+
+def _connect_smtp() -> smtplib.SMTP:
+    """
+    Open and authenticate a new SMTP connection.
+
+    Returns:
+        smtplib.SMTP: Connected (and logged in, if configured) client
+    """
+    # The connection is shared behind a lock, so a stalled server must not
+    # block every later send indefinitely
+    server = smtplib.SMTP(
+        settings.SMTP_HOST,
+        settings.SMTP_PORT,
+        timeout=settings.SMTP_TIMEOUT_SECONDS
+    )
+    try:
+        if settings.SMTP_USE_TLS:
+            server.starttls()
+
+        # Login if credentials are provided
+        if settings.SMTP_USERNAME and settings.SMTP_PASSWORD:
+            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _send_message(message: MIMEMultipart) -> None:
+    """
+    Send a message over the shared SMTP connection.
+
+    The connection is opened on first use. If the server has dropped it
+    (e.g. after an idle timeout), one new connection is opened and the
+    send is retried.
+
+    Args:
+        message: Message to send
+
+    Raises:
+        smtplib.SMTPException, OSError: If the message cannot be sent
+    """
+    global _smtp
+    with _smtp_lock:
+        for attempt in range(2):
+            if _smtp is None:
+                _smtp = _connect_smtp()
+            try:
+                _smtp.send_message(message)
+                return
+            except smtplib.SMTPServerDisconnected:
+                _smtp = None
+                if attempt:
+                    raise
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError):
+                # Rejected message; the connection itself is still usable
+                raise
+            except Exception:
+                # Unknown connection state: start over on the next send
+                _smtp.close()
+                _smtp = None
+                raise
+
+
+def close_smtp_connection() -> None:
+    """
+    Close the shared SMTP connection, if open.
+
+    Called on application shutdown.
+    """
+    global _smtp
+    with _smtp_lock:
+        if _smtp is not None:
+            try:
+                _smtp.quit()
+            except smtplib.SMTPException:
+                _smtp.close()
+            _smtp = None
+
+
 # ============================================================
 # Email Sending Functions
 # ============================================================
 
+# Sender header, identical for every email
+_FROM_HEADER = f"{settings.FROM_NAME} <{settings.FROM_EMAIL}>"
+
+
 def send_email(
     to_email: str,
     subject: str,
@@ -49,7 +149,8 @@ def send_email(
     Send an email using SMTP.
 
     This function sends HTML emails with optional plain text fallback.
-    It uses the SMTP settings from configuration.
+    It uses the SMTP settings from configuration, over a connection that
+    is reused across emails (see _send_message).
 
     Args:
         to_email: Recipient email address
@@ -72,7 +173,7 @@ def send_email(
     try:
         # Create message
         message = MIMEMultipart("alternative")
-        message["From"] = f"{settings.FROM_NAME} <{settings.FROM_EMAIL}>"
+        message["From"] = _FROM_HEADER
         message["To"] = to_email
         message["Subject"] = subject
 
@@ -85,93 +186,143 @@ def send_email(
         html_part = MIMEText(html_content, "html")
         message.attach(html_part)
 
-        # Connect to SMTP server and send email
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-            if settings.SMTP_USE_TLS:
-                server.starttls()
-
-            # Login if credentials are provided
-            if settings.SMTP_USERNAME and settings.SMTP_PASSWORD:
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-
-            # Send email
-            server.send_message(message)
+        # Send over the shared SMTP connection
+        _send_message(message)
 
-        logger.info(f"Email sent successfully to {to_email}")
+        logger.info("Email sent successfully to %s", to_email)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send email to {to_email}: {e}")
+        logger.error("Failed to send email to %s: %s", to_email, e)
         return False
 
 
 # ============================================================
-# Invitation Email Templates
+# Send Queue
 # ============================================================
 
-def send_invitation_email(
+# Emails waiting for the worker, as send_email arguments. None is the stop
+# signal. A thread-safe queue is used because the senders are called from
+# sync endpoints, which run in the threadpool rather than on the event loop.
+_email_queue: "queue.Queue[Optional[Tuple[str, str, str, Optional[str]]]]" = queue.Queue(
+    maxsize=settings.EMAIL_QUEUE_MAX_SIZE
+)
+_email_worker: Optional[threading.Thread] = None
+
+
+def _run_email_worker() -> None:
+    """
+    Send queued emails until the stop signal is received.
+
+    send_email logs and swallows its own failures, so one bad email
+    never stops the worker.
+    """
+    while True:
+        item = _email_queue.get()
+        if item is None:
+            return
+        send_email(*item)
+
+
+def start_email_worker() -> None:
+    """
+    Start the background thread that sends queued emails.
+
+    Called on application startup. Does nothing if already running.
+    """
+    global _email_worker
+    if _email_worker is None:
+        _email_worker = threading.Thread(
+            target=_run_email_worker,
+            name="email-worker",
+            daemon=True
+        )
+        _email_worker.start()
+
+
+def stop_email_worker() -> None:
+    """
+    Stop the email worker and close the shared SMTP connection.
+
+    Emails already queued are sent first, waiting at most
+    SMTP_TIMEOUT_SECONDS; anything left after that is dropped.
+    Called on application shutdown.
+    """
+    global _email_worker
+    if _email_worker is not None:
+        _email_queue.put(None)
+        _email_worker.join(settings.SMTP_TIMEOUT_SECONDS)
+        _email_worker = None
+    close_smtp_connection()
+
+
+def queue_email(
     to_email: str,
-    inviter_name: str,
-    company_name: str,
-    role: str,
-    invitation_url: str
+    subject: str,
+    html_content: str,
+    plain_content: Optional[str] = None
 ) -> bool:
     """
-    Send an invitation email to a new user.
+    Queue an email for the background worker.
 
-    This email invites the user to join the platform and includes
-    a unique invitation link.
+    Returns immediately instead of waiting on the SMTP round-trip. If the
+    queue is full the email is dropped and logged. If the worker is not
+    running (e.g. the application was started without its lifespan), the
+    email is sent inline instead.
 
     Args:
-        to_email: Email address of the invitee
-        inviter_name: Name of the person who sent the invitation
-        company_name: Name of the company they're being invited to
-        role: Role they will have (admin or user)
-        invitation_url: Unique invitation URL with token
+        to_email: Recipient email address
+        subject: Email subject line
+        html_content: HTML content of the email
+        plain_content: Plain text content (fallback for non-HTML clients)
 
     Returns:
-        bool: True if email sent successfully, False otherwise
-
-    Example:
-        >>> send_invitation_email(
-        >>>     to_email="newuser@example.com",
-        >>>     inviter_name="John Admin",
-        >>>     company_name="Acme Corp",
-        >>>     role="user",
-        >>>     invitation_url="https://app.example.com/accept?token=abc123"
-        >>> )
+        bool: True if the email was queued (or sent inline), False otherwise
     """
-    subject = f"You've been invited to join {company_name} on Simple Digital Signage"
+    if _email_worker is None:
+        return send_email(to_email, subject, html_content, plain_content)
 
-    # HTML email content
-    html_content = f"""
+    try:
+        _email_queue.put_nowait((to_email, subject, html_content, plain_content))
+    except queue.Full:
+        logger.error("Email queue full, dropping email to %s", to_email)
+        return False
+    return True
+
+
+# ============================================================
+# Invitation Email Templates
+# ============================================================
+
+# Compiled once at import; only the placeholders vary per email
+_INVITATION_HTML = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 line-height: 1.6;
                 color: #333;
-            }}
-            .container {{
+            }
+            .container {
                 max-width: 600px;
                 margin: 0 auto;
                 padding: 20px;
-            }}
-            .header {{
+            }
+            .header {
                 background-color: #4CAF50;
                 color: white;
                 padding: 20px;
                 text-align: center;
                 border-radius: 5px 5px 0 0;
-            }}
-            .content {{
+            }
+            .content {
                 background-color: #f9f9f9;
                 padding: 30px;
                 border-radius: 0 0 5px 5px;
-            }}
-            .button {{
+            }
+            .button {
                 display: inline-block;
                 padding: 12px 30px;
                 background-color: #4CAF50;
@@ -179,21 +330,21 @@ def send_invitation_email(
                 text-decoration: none;
                 border-radius: 5px;
                 margin: 20px 0;
-            }}
-            .footer {{
+            }
+            .footer {
                 text-align: center;
                 margin-top: 20px;
                 font-size: 12px;
                 color: #666;
-            }}
-            .role-badge {{
+            }
+            .role-badge {
                 display: inline-block;
                 padding: 5px 10px;
                 background-color: #2196F3;
                 color: white;
                 border-radius: 3px;
                 font-size: 14px;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -203,106 +354,134 @@ def send_invitation_email(
             </div>
             <div class="content">
                 <p>Hi there,</p>
-                <p><strong>{inviter_name}</strong> has invited you to join <strong>{company_name}</strong> on Simple Digital Signage.</p>
-                <p>You will be joining as: <span class="role-badge">{role.upper()}</span></p>
+                <p><strong>$inviter_name</strong> has invited you to join <strong>$company_name</strong> on Simple Digital Signage.</p>
+                <p>You will be joining as: <span class="role-badge">$role</span></p>
                 <p>Simple Digital Signage allows you to manage and display digital content on Smart TVs, perfect for digital signage solutions.</p>
                 <p>Click the button below to accept the invitation and set up your account:</p>
                 <p style="text-align: center;">
-                    <a href="{invitation_url}" class="button">Accept Invitation</a>
+                    <a href="$invitation_url" class="button">Accept Invitation</a>
                 </p>
                 <p><small>Or copy and paste this link into your browser:</small><br>
-                <code>{invitation_url}</code></p>
+                <code>$invitation_url</code></p>
                 <p><strong>Note:</strong> This invitation link will expire in 72 hours.</p>
                 <p>If you didn't expect this invitation, you can safely ignore this email.</p>
             </div>
             <div class="footer">
-                <p>&copy; {datetime.utcnow().year} Simple Digital Signage. All rights reserved.</p>
+                <p>&copy; $year Simple Digital Signage. All rights reserved.</p>
             </div>
         </div>
     </body>
     </html>
-    """
+    """)
 
-    # Plain text fallback
-    plain_content = f"""
+_INVITATION_TEXT = Template("""
     You're Invited!
 
     Hi there,
 
-    {inviter_name} has invited you to join {company_name} on Simple Digital Signage.
+    $inviter_name has invited you to join $company_name on Simple Digital Signage.
 
-    You will be joining as: {role.upper()}
+    You will be joining as: $role
 
     Click the link below to accept the invitation and set up your account:
-    {invitation_url}
+    $invitation_url
 
     Note: This invitation link will expire in 72 hours.
 
     If you didn't expect this invitation, you can safely ignore this email.
 
-    © {datetime.utcnow().year} Simple Digital Signage. All rights reserved.
-    """
-
-    return send_email(to_email, subject, html_content, plain_content)
-
+    © $year Simple Digital Signage. All rights reserved.
+    """)
 
-# ============================================================
-# Welcome Email
-# ============================================================
 
-def send_welcome_email(
+def send_invitation_email(
     to_email: str,
-    full_name: str,
+    inviter_name: str,
     company_name: str,
-    role: str
+    role: str,
+    invitation_url: str
 ) -> bool:
     """
-    Send a welcome email to a newly registered user.
+    Send an invitation email to a new user.
+
+    This email invites the user to join the platform and includes
+    a unique invitation link.
 
     Args:
-        to_email: User's email address
-        full_name: User's full name
-        company_name: Company name
-        role: User's role
+        to_email: Email address of the invitee
+        inviter_name: Name of the person who sent the invitation
+        company_name: Name of the company they're being invited to
+        role: Role they will have (admin or user)
+        invitation_url: Unique invitation URL with token
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if the email was queued, False otherwise
+
+    Example:
+        >>> send_invitation_email(
+        >>>     to_email="newuser@example.com",
+        >>>     inviter_name="John Admin",
+        >>>     company_name="Acme Corp",
+        >>>     role="user",
+        >>>     invitation_url="https://app.example.com/accept?token=abc123"
+        >>> )
     """
-    subject = f"Welcome to Simple Digital Signage, {full_name}!"
+    subject = f"You've been invited to join {company_name} on Simple Digital Signage"
+
+    values = {
+        "inviter_name": inviter_name,
+        "company_name": company_name,
+        "role": role.upper(),
+        "invitation_url": invitation_url,
+        "year": datetime.now(timezone.utc).year
+    }
+
+    # HTML email content
+    html_content = _INVITATION_HTML.substitute(values)
+
+    # Plain text fallback
+    plain_content = _INVITATION_TEXT.substitute(values)
+
+    return queue_email(to_email, subject, html_content, plain_content)
+
 
-    html_content = f"""
+# ============================================================
+# Welcome Email
+# ============================================================
+
+_WELCOME_HTML = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 line-height: 1.6;
                 color: #333;
-            }}
-            .container {{
+            }
+            .container {
                 max-width: 600px;
                 margin: 0 auto;
                 padding: 20px;
-            }}
-            .header {{
+            }
+            .header {
                 background-color: #4CAF50;
                 color: white;
                 padding: 20px;
                 text-align: center;
                 border-radius: 5px 5px 0 0;
-            }}
-            .content {{
+            }
+            .content {
                 background-color: #f9f9f9;
                 padding: 30px;
                 border-radius: 0 0 5px 5px;
-            }}
-            .footer {{
+            }
+            .footer {
                 text-align: center;
                 margin-top: 20px;
                 font-size: 12px;
                 color: #666;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -311,9 +490,9 @@ def send_welcome_email(
                 <h1>Welcome to Simple Digital Signage!</h1>
             </div>
             <div class="content">
-                <p>Hi {full_name},</p>
-                <p>Welcome to <strong>{company_name}</strong> on Simple Digital Signage!</p>
-                <p>Your account has been successfully created as a <strong>{role}</strong>.</p>
+                <p>Hi $full_name,</p>
+                <p>Welcome to <strong>$company_name</strong> on Simple Digital Signage!</p>
+                <p>Your account has been successfully created as a <strong>$role</strong>.</p>
                 <h3>Getting Started:</h3>
                 <ul>
                     <li>Connect your Google Drive to import content</li>
@@ -325,21 +504,21 @@ def send_welcome_email(
                 <p>Best regards,<br>The Simple Digital Signage Team</p>
             </div>
             <div class="footer">
-                <p>&copy; {datetime.utcnow().year} Simple Digital Signage. All rights reserved.</p>
+                <p>&copy; $year Simple Digital Signage. All rights reserved.</p>
             </div>
         </div>
     </body>
     </html>
-    """
+    """)
 
-    plain_content = f"""
+_WELCOME_TEXT = Template("""
     Welcome to Simple Digital Signage!
 
-    Hi {full_name},
+    Hi $full_name,
 
-    Welcome to {company_name} on Simple Digital Signage!
+    Welcome to $company_name on Simple Digital Signage!
 
-    Your account has been successfully created as a {role}.
+    Your account has been successfully created as a $role.
 
     Getting Started:
     - Connect your Google Drive to import content
@@ -352,89 +531,133 @@ def send_welcome_email(
     Best regards,
     The Simple Digital Signage Team
 
-    © {datetime.utcnow().year} Simple Digital Signage. All rights reserved.
-    """
-
-    return send_email(to_email, subject, html_content, plain_content)
-
+    © $year Simple Digital Signage. All rights reserved.
+    """)
 
-# ============================================================
-# Device Linked Notification
-# ============================================================
 
-def send_device_linked_email(
+def send_welcome_email(
     to_email: str,
     full_name: str,
-    device_name: str,
-    device_code: str
+    company_name: str,
+    role: str
 ) -> bool:
     """
-    Send notification email when a new device is linked.
+    Send a welcome email to a newly registered user.
 
     Args:
         to_email: User's email address
         full_name: User's full name
-        device_name: Name of the linked device
-        device_code: Device pairing code used
+        company_name: Company name
+        role: User's role
 
     Returns:
-        bool: True if email sent successfully, False otherwise
+        bool: True if the email was queued, False otherwise
     """
-    subject = "New Device Linked to Your Account"
+    subject = f"Welcome to Simple Digital Signage, {full_name}!"
+
+    values = {
+        "full_name": full_name,
+        "company_name": company_name,
+        "role": role,
+        "year": datetime.now(timezone.utc).year
+    }
+
+    html_content = _WELCOME_HTML.substitute(values)
+
+    plain_content = _WELCOME_TEXT.substitute(values)
+
+    return queue_email(to_email, subject, html_content, plain_content)
+
+
+# ============================================================
+# Device Linked Notification
+# ============================================================
 
-    html_content = f"""
+_DEVICE_LINKED_HTML = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 line-height: 1.6;
                 color: #333;
-            }}
-            .container {{
+            }
+            .container {
                 max-width: 600px;
                 margin: 0 auto;
                 padding: 20px;
-            }}
-            .content {{
+            }
+            .content {
                 background-color: #f9f9f9;
                 padding: 30px;
                 border-radius: 5px;
-            }}
+            }
         </style>
     </head>
     <body>
         <div class="container">
             <div class="content">
                 <h2>Device Linked Successfully</h2>
-                <p>Hi {full_name},</p>
+                <p>Hi $full_name,</p>
                 <p>A new device has been linked to your Simple Digital Signage account:</p>
-                <p><strong>Device Name:</strong> {device_name}<br>
-                <strong>Pairing Code:</strong> {device_code}<br>
-                <strong>Linked At:</strong> {datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")}</p>
+                <p><strong>Device Name:</strong> $device_name<br>
+                <strong>Pairing Code:</strong> $device_code<br>
+                <strong>Linked At:</strong> $linked_at</p>
                 <p>If you didn't link this device, please contact your administrator immediately.</p>
             </div>
         </div>
     </body>
     </html>
-    """
+    """)
 
-    plain_content = f"""
+_DEVICE_LINKED_TEXT = Template("""
     Device Linked Successfully
 
-    Hi {full_name},
+    Hi $full_name,
 
     A new device has been linked to your Simple Digital Signage account:
 
-    Device Name: {device_name}
-    Pairing Code: {device_code}
-    Linked At: {datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")}
+    Device Name: $device_name
+    Pairing Code: $device_code
+    Linked At: $linked_at
 
     If you didn't link this device, please contact your administrator immediately.
+    """)
+
+
+def send_device_linked_email(
+    to_email: str,
+    full_name: str,
+    device_name: str,
+    device_code: str
+) -> bool:
     """
+    Send notification email when a new device is linked.
 
-    return send_email(to_email, subject, html_content, plain_content)
+    Args:
+        to_email: User's email address
+        full_name: User's full name
+        device_name: Name of the linked device
+        device_code: Device pairing code used
+
+    Returns:
+        bool: True if the email was queued, False otherwise
+    """
+    subject = "New Device Linked to Your Account"
+
+    values = {
+        "full_name": full_name,
+        "device_name": device_name,
+        "device_code": device_code,
+        "linked_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    }
+
+    html_content = _DEVICE_LINKED_HTML.substitute(values)
+
+    plain_content = _DEVICE_LINKED_TEXT.substitute(values)
+
+    return queue_email(to_email, subject, html_content, plain_content)
 
 
 # ============================================================
@@ -7,7 +7,7 @@ such as Google credentials, access tokens, and API keys.
 
 Encryption Method:
 - Algorithm: AES-256 in GCM mode (Galois/Counter Mode)
-- Key derivation: PBKDF2 with SHA-256
+- Key derivation: PBKDF2 with SHA-256, once per ENCRYPTION_KEY
 - Authentication: Built-in with GCM mode
 - Encoding: Base64 for storage
 
@@ -15,6 +15,7 @@ Security Features:
 - Each encryption uses a unique random nonce (IV)
 - Authentication tag prevents tampering
 - Key is derived from ENCRYPTION_KEY environment variable
+- The derived key is cached, so PBKDF2 is not on the per-call path
 - Constant-time comparison prevents timing attacks
 
 IMPORTANT:
@@ -23,13 +24,19 @@ IMPORTANT:
 - In production, consider using a key management service (KMS)
 """
 
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.backends.openssl import backend as openssl_backend
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-import base64
-import os
-import secrets
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from os import urandom as _urandom
+import binascii
+import hashlib
+import platform
+import re
+import time
 import logging
+from typing import List, Optional
 
 from app.config import settings
 
@@ -64,36 +71,144 @@ def _derive_key(password: str, salt: bytes = None) -> tuple[bytes, bytes]:
         - Random 16-byte salt
     """
     if salt is None:
-        salt = secrets.token_bytes(16)  # 16 bytes = 128 bits
-
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,  # 32 bytes = 256 bits for AES-256
-        salt=salt,
-        iterations=100000,  # OWASP recommendation
+        salt = _urandom(16)  # 16 bytes = 128 bits
+
+    # hashlib calls OpenSSL's PBKDF2 directly, with less wrapping than
+    # cryptography's PBKDF2HMAC; the derived key is identical
+    key = hashlib.pbkdf2_hmac(
+        "sha256",
+        password.encode(),
+        salt,
+        100000,  # OWASP recommendation
+        dklen=32  # 32 bytes = 256 bits for AES-256
     )
-
-    key = kdf.derive(password.encode())
     return key, salt
 
 
+# First byte of data encrypted with the master key. Data without it uses
+# the legacy format with a per-record salt (see decrypt_data).
+_MASTER_KEY_VERSION = b"\x01"
+
+
+@lru_cache(maxsize=4)
+def _master_cipher(password: str) -> AESGCM:
+    """
+    Get the AES-GCM cipher for the master key derived from a password.
+
+    The password never changes at runtime, so PBKDF2 runs once per
+    password instead of on every encrypt/decrypt call. The salt is derived
+    from the password itself, making the key deterministic without
+    storing the salt anywhere. Keyed by password, so calls with an explicit
+    key (e.g. during key rotation) get their own cipher.
+
+    Args:
+        password: The password/key from settings
+
+    Returns:
+        AESGCM: Cipher for the derived 256-bit key
+    """
+    salt = hashlib.sha256(b"encryption-master-salt-" + password.encode()).digest()[:16]
+    key, _ = _derive_key(password, salt)
+    return AESGCM(key)
+
+
+@lru_cache(maxsize=1024)
+def _legacy_cipher(password: str, salt: bytes) -> AESGCM:
+    """
+    Get the AES-GCM cipher for a legacy record's per-record salt.
+
+    Memoized, so decrypting the same legacy record again (or a batch
+    re-decrypt) skips PBKDF2.
+
+    Args:
+        password: The password/key from settings
+        salt: 16-byte salt stored at the start of the record
+
+    Returns:
+        AESGCM: Cipher for the derived 256-bit key
+    """
+    key, _ = _derive_key(password, salt)
+    return AESGCM(key)
+
+
 # ============================================================
 # Encryption Functions
 # ============================================================
 
-def encrypt_data(plaintext: str) -> str:
+def _seal(aesgcm: AESGCM, plaintext_bytes: bytes) -> str:
+    """
+    Encrypt bytes with a cipher and encode the result for storage.
+
+    Args:
+        aesgcm: Cipher for the master key
+        plaintext_bytes: The data to encrypt
+
+    Returns:
+        str: Base64-encoded [version][nonce][ciphertext+tag]
+    """
+    # Generate random nonce (12 bytes recommended for GCM)
+    nonce = _urandom(12)
+
+    # Encrypt the data
+    # GCM mode automatically adds authentication tag to ciphertext
+    ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
+
+    # Combine version + nonce + ciphertext
+    # Format: [1 byte version][12 bytes nonce][variable ciphertext+tag]
+    # (joined in one allocation)
+    encrypted_data = b"".join((_MASTER_KEY_VERSION, nonce, ciphertext))
+
+    # Encode as base64 for storage
+    return binascii.b2a_base64(encrypted_data, newline=False).decode('ascii')
+
+
+def encrypt_bytes(plaintext_bytes: bytes, *, key: Optional[str] = None) -> str:
+    """
+    Encrypt raw bytes using AES-256-GCM.
+
+    Same as encrypt_data, for callers that already hold bytes (such as
+    key rotation feeding in decrypt_data_bytes output), so no UTF-8
+    encode is needed.
+
+    Args:
+        plaintext_bytes: The data to encrypt (as bytes)
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
+
+    Returns:
+        str: Base64-encoded encrypted data
+
+    Raises:
+        ValueError: If plaintext is empty or encryption fails
+
+    Example:
+        >>> encrypted = encrypt_bytes(b"my-secret-token")
+    """
+    if not plaintext_bytes:
+        raise ValueError("Cannot encrypt empty data")
+
+    try:
+        # Cipher for the cached master key
+        return _seal(_master_cipher(key or _settings_key()), plaintext_bytes)
+
+    except Exception as e:
+        logger.error("Encryption failed: %s", e)
+        raise ValueError(f"Failed to encrypt data: {e}")
+
+
+def encrypt_data(plaintext: str, *, key: Optional[str] = None) -> str:
     """
     Encrypt sensitive data using AES-256-GCM.
 
     This function encrypts data using AES-256 in GCM mode, which provides
     both confidentiality and authenticity. The encrypted data includes:
-    - Salt (for key derivation)
+    - Format version byte
     - Nonce (IV for AES-GCM)
     - Ciphertext
     - Authentication tag (built into GCM)
 
     Args:
         plaintext: The data to encrypt (as string)
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
 
     Returns:
         str: Base64-encoded encrypted data
@@ -115,58 +230,35 @@ def encrypt_data(plaintext: str) -> str:
     if not plaintext:
         raise ValueError("Cannot encrypt empty data")
 
-    try:
-        # Convert plaintext to bytes
-        plaintext_bytes = plaintext.encode('utf-8')
-
-        # Derive key with random salt
-        key, salt = _derive_key(settings.ENCRYPTION_KEY)
-
-        # Generate random nonce (12 bytes recommended for GCM)
-        nonce = secrets.token_bytes(12)
-
-        # Create AESGCM cipher
-        aesgcm = AESGCM(key)
-
-        # Encrypt the data
-        # GCM mode automatically adds authentication tag to ciphertext
-        ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
-
-        # Combine salt + nonce + ciphertext
-        # Format: [16 bytes salt][12 bytes nonce][variable ciphertext+tag]
-        encrypted_data = salt + nonce + ciphertext
-
-        # Encode as base64 for storage
-        encoded = base64.b64encode(encrypted_data).decode('utf-8')
-
-        return encoded
-
-    except Exception as e:
-        logger.error(f"Encryption failed: {e}")
-        raise ValueError(f"Failed to encrypt data: {e}")
+    return encrypt_bytes(plaintext.encode('utf-8'), key=key)
 
 
-def decrypt_data(ciphertext: str) -> str:
+def decrypt_data_bytes(ciphertext: str, *, key: Optional[str] = None) -> bytes:
     """
-    Decrypt data that was encrypted with encrypt_data().
+    Decrypt data that was encrypted with encrypt_data() or encrypt_bytes().
+
+    This function reverses the encryption process, extracting the nonce
+    and ciphertext, then decrypting using AES-256-GCM.
 
-    This function reverses the encryption process, extracting the salt,
-    nonce, and ciphertext, then decrypting using AES-256-GCM.
+    Data encrypted before the master key was introduced has the format
+    [16 bytes salt][12 bytes nonce][ciphertext+tag] and is decrypted with
+    a key derived from its own salt (one PBKDF2 run per call).
 
     Args:
         ciphertext: Base64-encoded encrypted data
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
 
     Returns:
-        str: Decrypted plaintext
+        bytes: Decrypted plaintext (not decoded)
 
     Raises:
         ValueError: If ciphertext is invalid or decryption fails
         Exception: If authentication tag verification fails (data tampered)
 
     Example:
-        >>> plaintext = decrypt_data(encrypted)
+        >>> plaintext = decrypt_data_bytes(encrypted)
         >>> print(plaintext)
-        'my-secret-token'
+        b'my-secret-token'
 
     Security:
         - Verifies authentication tag before decryption
@@ -177,46 +269,134 @@ def decrypt_data(ciphertext: str) -> str:
         raise ValueError("Cannot decrypt empty data")
 
     try:
+        password = key or _settings_key()
+
         # Decode from base64
-        encrypted_data = base64.b64decode(ciphertext.encode('utf-8'))
+        encrypted_data = binascii.a2b_base64(ciphertext)
 
-        # Extract components
-        # Format: [16 bytes salt][12 bytes nonce][variable ciphertext+tag]
-        salt = encrypted_data[:16]
-        nonce = encrypted_data[16:28]
-        ciphertext_bytes = encrypted_data[28:]
+        # Slices of a memoryview share the decoded buffer instead of copying
+        view = memoryview(encrypted_data)
+
+        # Current format: [1 byte version][12 bytes nonce][ciphertext+tag]
+        if encrypted_data[:1] == _MASTER_KEY_VERSION:
+            try:
+                return _master_cipher(password).decrypt(view[1:13], view[13:], None)
+            except InvalidTag:
+                # A legacy salt can start with the same byte; try that format
+                pass
 
-        # Derive key using the same salt
-        key, _ = _derive_key(settings.ENCRYPTION_KEY, salt)
+        # Legacy format: [16 bytes salt][12 bytes nonce][variable ciphertext+tag]
+        # (salt stays bytes: it is part of the _legacy_cipher cache key)
+        salt = encrypted_data[:16]
+        nonce = view[16:28]
+        ciphertext_bytes = view[28:]
 
-        # Create AESGCM cipher
-        aesgcm = AESGCM(key)
+        # Cipher for the key derived from the same salt
+        aesgcm = _legacy_cipher(password, salt)
 
         # Decrypt the data
         # GCM automatically verifies authentication tag
         # Raises exception if tag verification fails (data tampered)
-        plaintext_bytes = aesgcm.decrypt(nonce, ciphertext_bytes, None)
+        return aesgcm.decrypt(nonce, ciphertext_bytes, None)
+
+    except Exception as e:
+        logger.error("Decryption failed: %s", e)
+        raise ValueError(f"Failed to decrypt data: {e}")
+
+
+def decrypt_data(ciphertext: str, *, key: Optional[str] = None) -> str:
+    """
+    Decrypt data that was encrypted with encrypt_data().
+
+    Args:
+        ciphertext: Base64-encoded encrypted data
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
+
+    Returns:
+        str: Decrypted plaintext
 
-        # Convert bytes back to string
-        plaintext = plaintext_bytes.decode('utf-8')
+    Raises:
+        ValueError: If ciphertext is invalid, decryption fails or the
+            plaintext is not valid UTF-8
+
+    Example:
+        >>> plaintext = decrypt_data(encrypted)
+        >>> print(plaintext)
+        'my-secret-token'
+    """
+    return decrypt_data_bytes(ciphertext, key=key).decode('utf-8')
+
+
+def encrypt_batch(plaintexts: List[str], *, key: Optional[str] = None) -> List[str]:
+    """
+    Encrypt many values with AES-256-GCM.
+
+    Produces the same format as encrypt_data, looking up the cipher once
+    for the whole batch. Each value still gets its own random nonce.
+
+    Args:
+        plaintexts: The data to encrypt (as strings)
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
+
+    Returns:
+        list: Base64-encoded encrypted data, in the same order
+
+    Raises:
+        ValueError: If any plaintext is empty or encryption fails
+
+    Example:
+        >>> encrypted = encrypt_batch(["token-1", "token-2"])
+    """
+    if not all(plaintexts):
+        raise ValueError("Cannot encrypt empty data")
+
+    try:
+        aesgcm = _master_cipher(key or _settings_key())
 
-        return plaintext
+        return [_seal(aesgcm, plaintext.encode('utf-8')) for plaintext in plaintexts]
 
     except Exception as e:
-        logger.error(f"Decryption failed: {e}")
-        raise ValueError(f"Failed to decrypt data: {e}")
+        logger.error("Batch encryption failed: %s", e)
+        raise ValueError(f"Failed to encrypt data: {e}")
+
+
+def decrypt_batch(ciphertexts: List[str], *, key: Optional[str] = None) -> List[str]:
+    """
+    Decrypt many values encrypted with encrypt_data() or encrypt_batch().
+
+    Ciphers are memoized per key (and per salt for legacy records), so
+    values sharing a key reuse one cipher and PBKDF2 runs at most once
+    per distinct salt.
+
+    Args:
+        ciphertexts: Base64-encoded encrypted data
+        key: Encryption key to use instead of settings.ENCRYPTION_KEY
+
+    Returns:
+        list: Decrypted plaintexts, in the same order
+
+    Raises:
+        ValueError: If any value cannot be decrypted
+    """
+    return [decrypt_data(ciphertext, key=key) for ciphertext in ciphertexts]
 
 
 # ============================================================
 # Helper Functions
 # ============================================================
 
+# Standard base64 alphabet with optional trailing padding
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+
 def is_encrypted(data: str) -> bool:
     """
     Check if data appears to be encrypted.
 
     This is a simple heuristic check - it doesn't guarantee the data
     is encrypted with our system, just that it looks like base64.
+    Nothing is decoded: the shape is checked with a precompiled pattern
+    and the decoded length is computed from the encoded length.
 
     Args:
         data: String to check
@@ -231,15 +411,14 @@ def is_encrypted(data: str) -> bool:
         >>> print(is_encrypted("plain text"))
         False
     """
-    try:
-        # Try to decode as base64
-        decoded = base64.b64decode(data.encode('utf-8'))
-        # Check if it has minimum length (salt + nonce + some data)
-        # 16 (salt) + 12 (nonce) + 16 (min ciphertext) = 44 bytes minimum
-        return len(decoded) >= 44
-    except Exception:
+    if not isinstance(data, str) or len(data) % 4 or not _BASE64_PATTERN.fullmatch(data):
         return False
 
+    # Check if it has minimum length (version + nonce + tag)
+    # 1 (version) + 12 (nonce) + 16 (tag) = 29 bytes minimum
+    decoded_length = len(data) // 4 * 3 - data.count("=", -2)
+    return decoded_length >= 29
+
 
 def rotate_encryption_key(old_key: str, new_key: str, encrypted_data: str) -> str:
     """
@@ -261,15 +440,13 @@ def rotate_encryption_key(old_key: str, new_key: str, encrypted_data: str) -> st
         ValueError: If re-encryption fails
 
     Example:
-        >>> # Rotate all encrypted data in database
-        >>> credentials = db.query(GoogleCredential).all()
-        >>> for cred in credentials:
-        >>>     cred.client_secret = rotate_encryption_key(
-        >>>         old_key=old_encryption_key,
-        >>>         new_key=new_encryption_key,
-        >>>         encrypted_data=cred.client_secret
-        >>>     )
+        >>> cred.client_secret = rotate_encryption_key(
+        >>>     old_key=old_encryption_key,
+        >>>     new_key=new_encryption_key,
+        >>>     encrypted_data=cred.client_secret
+        >>> )
         >>> db.commit()
+        >>> # For many rows, use rotate_encryption_key_batch
 
     WARNING:
         - This is a sensitive operation
@@ -277,28 +454,76 @@ def rotate_encryption_key(old_key: str, new_key: str, encrypted_data: str) -> st
         - All encrypted data must be re-encrypted atomically
     """
     try:
-        # Temporarily set old key
-        original_key = settings.ENCRYPTION_KEY
-        settings.ENCRYPTION_KEY = old_key
+        # Keys are passed explicitly; settings.ENCRYPTION_KEY is never
+        # touched, so concurrent requests keep using the current key.
+        # The plaintext stays bytes (no UTF-8 decode/encode round-trip)
+        plaintext_bytes = decrypt_data_bytes(encrypted_data, key=old_key)
+        return encrypt_bytes(plaintext_bytes, key=new_key)
 
-        # Decrypt with old key
-        plaintext = decrypt_data(encrypted_data)
+    except Exception as e:
+        logger.error("Key rotation failed: %s", e)
+        raise ValueError(f"Failed to rotate encryption key: {e}")
 
-        # Set new key
-        settings.ENCRYPTION_KEY = new_key
 
-        # Encrypt with new key
-        new_encrypted = encrypt_data(plaintext)
+def rotate_encryption_key_batch(
+    old_key: str,
+    new_key: str,
+    encrypted_items: List[str],
+    max_workers: int = 1
+) -> List[str]:
+    """
+    Re-encrypt many values with a new encryption key.
 
-        # Restore original key
-        settings.ENCRYPTION_KEY = original_key
+    Same as calling rotate_encryption_key for each value, but each
+    key's cipher is looked up once for the whole batch.
 
-        return new_encrypted
+    With max_workers > 1 the values are split into that many contiguous
+    chunks, rotated on a thread pool (keys are passed explicitly, so
+    this is thread-safe). Chunks rather than single values are
+    submitted: per-value dispatch costs more than the AES-GCM work.
+
+    Args:
+        old_key: The old encryption key
+        new_key: The new encryption key
+        encrypted_items: Values encrypted with old key
+        max_workers: Number of threads to use (default: current thread only)
+
+    Returns:
+        list: Values encrypted with new key, in the same order
+
+    Raises:
+        ValueError: If any value cannot be re-encrypted (nothing is returned)
+
+    Example:
+        >>> credentials = db.query(GoogleCredential).all()
+        >>> rotated = rotate_encryption_key_batch(
+        >>>     old_encryption_key,
+        >>>     new_encryption_key,
+        >>>     [cred.client_secret for cred in credentials]
+        >>> )
+        >>> for cred, value in zip(credentials, rotated):
+        >>>     cred.client_secret = value
+        >>> db.commit()
+    """
+    def rotate_chunk(chunk: List[str]) -> List[str]:
+        # Plaintexts stay bytes between decrypt and re-encrypt
+        aesgcm = _master_cipher(new_key)
+        return [_seal(aesgcm, decrypt_data_bytes(value, key=old_key)) for value in chunk]
+
+    try:
+        if max_workers <= 1 or len(encrypted_items) < 2:
+            return rotate_chunk(encrypted_items)
+
+        chunk_size = -(-len(encrypted_items) // max_workers)  # ceiling division
+        chunks = [
+            encrypted_items[start:start + chunk_size]
+            for start in range(0, len(encrypted_items), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [value for rotated in executor.map(rotate_chunk, chunks) for value in rotated]
 
     except Exception as e:
-        # Restore original key on error
-        settings.ENCRYPTION_KEY = original_key
-        logger.error(f"Key rotation failed: {e}")
+        logger.error("Batch key rotation failed: %s", e)
         raise ValueError(f"Failed to rotate encryption key: {e}")
 
 
@@ -315,6 +540,8 @@ def validate_encryption_key() -> bool:
     - Key is not the default value
     - Key is strong enough (minimum length)
 
+    A valid key's master key is derived right away (see _master_cipher).
+
     Returns:
         bool: True if key is valid, False otherwise
 
@@ -339,10 +566,70 @@ def validate_encryption_key() -> bool:
         logger.warning("ENCRYPTION_KEY is too short - use at least 32 characters")
         return False
 
+    # Derive the master key now (the only PBKDF2 run for current-format
+    # data) so the first request that encrypts or decrypts doesn't pay it
+    _master_cipher(key)
+
     logger.info("Encryption key validation passed")
     return True
 
 
+def _cpu_has_aes() -> Optional[bool]:
+    """
+    Check the CPU flags for hardware AES support.
+
+    Returns:
+        bool: Whether the CPU advertises AES instructions, or None if
+        this can't be determined on this platform
+    """
+    if platform.system() != "Linux":
+        return None
+
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                # "flags" on x86, "Features" on ARM
+                if line.startswith(("flags", "Features")):
+                    return "aes" in line.split(":", 1)[1].split()
+    except OSError:
+        pass
+    return None
+
+
+def validate_crypto_backend() -> bool:
+    """
+    Check that AES-GCM can use hardware-accelerated AES.
+
+    OpenSSL uses AES instructions automatically when the CPU has them.
+    A container on a host without them falls back to software AES, which
+    is several times slower, so this is logged at startup. Also logs the
+    OpenSSL version and a quick 4 KiB AES-GCM self-test timing.
+
+    Returns:
+        bool: False if the CPU is known to lack AES instructions
+
+    Example:
+        >>> if not validate_crypto_backend():
+        >>>     logger.warning("Encryption will run without AES acceleration")
+    """
+    logger.info("Cryptography backend: %s", openssl_backend.openssl_version_text())
+
+    # Self-test: 100 encryptions of 4 KiB with a throwaway key
+    aesgcm = AESGCM(AESGCM.generate_key(bit_length=256))
+    block = bytes(4096)
+    nonce = bytes(12)
+    start = time.perf_counter()
+    for _ in range(100):
+        aesgcm.encrypt(nonce, block, None)
+    elapsed_us = (time.perf_counter() - start) * 1e4  # microseconds per call
+    logger.info("AES-GCM self-test: %.1f us per 4 KiB", elapsed_us)
+
+    if _cpu_has_aes() is False:
+        logger.warning("CPU does not advertise AES instructions - AES-GCM will run in software")
+        return False
+    return True
+
+
 # ============================================================
 # Test Functions (for development only)
 # ============================================================
@@ -383,14 +670,32 @@ def test_encryption():
 
 
 # ============================================================
-# Initialize encryption key validation on module load
+# Lazy encryption key validation
 # ============================================================
 
-# Validate encryption key when module is imported
-# This ensures the key is valid before any encryption operations
-if settings.APP_ENV == "production":
-    if not validate_encryption_key():
-        raise ValueError(
-            "Invalid encryption key configuration. "
-            "Please set a strong ENCRYPTION_KEY in environment variables."
-        )
+# In production the configured key is validated before its first use
+# rather than at import, so importing this module (every worker boot)
+# doesn't pay for PBKDF2; the application lifespan validates it at
+# startup anyway
+_settings_key_validated = False
+
+
+def _settings_key() -> str:
+    """
+    Get settings.ENCRYPTION_KEY, validating it on first use in production.
+
+    Returns:
+        str: The configured encryption key
+
+    Raises:
+        ValueError: If the key is invalid (production only)
+    """
+    global _settings_key_validated
+    if not _settings_key_validated:
+        if settings.APP_ENV == "production" and not validate_encryption_key():
+            raise ValueError(
+                "Invalid encryption key configuration. "
+                "Please set a strong ENCRYPTION_KEY in environment variables."
+            )
+        _settings_key_validated = True
+    return settings.ENCRYPTION_KEY
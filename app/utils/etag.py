@@ -0,0 +1,92 @@
+"""
+ETag Utilities
+==============
+
+This module provides helpers for conditional GET responses.
+
+A strong ETag (hash of the serialized body) is sent with the response.
+Clients that repeat the request with the same value in If-None-Match get
+an empty 304 Not Modified instead of the full body, which saves bandwidth
+for repeat callers such as dashboards and load balancers.
+
+Usage in API routes:
+    body = orjson.dumps(result)
+    return etag_response(request, body)
+"""
+
+from fastapi import Request, Response, status
+from typing import Dict, Optional
+import hashlib
+
+
+# ============================================================
+# ETag Helpers
+# ============================================================
+
+def compute_etag(body: bytes) -> str:
+    """
+    Compute a strong ETag for a response body.
+
+    Args:
+        body: Serialized response body
+
+    Returns:
+        str: Quoted ETag value
+
+    Example:
+        >>> compute_etag(b'{"status":"ready"}')
+        '"4c1f..."'
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        bool: True if the client already has this version
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def etag_response(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Build a JSON response with an ETag, or a 304 if the client has it.
+
+    Args:
+        request: Incoming request
+        body: Serialized JSON body
+        etag: Precomputed ETag for body (computed if omitted)
+        headers: Extra response headers
+
+    Returns:
+        Response: 200 with body, or 304 Not Modified without body
+
+    Example:
+        >>> return etag_response(request, orjson.dumps(companies))
+    """
+    etag = etag or compute_etag(body)
+    response_headers = {**(headers or {}), "ETag": etag}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=response_headers)
+
+    return Response(content=body, media_type="application/json", headers=response_headers)
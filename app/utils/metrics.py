@@ -0,0 +1,73 @@
+"""
+Request Metrics
+===============
+
+This module keeps a rolling sample of request durations for monitoring.
+
+Every HTTP request's duration is appended to a fixed-size ring buffer by
+the observability middleware in main.py. Percentiles are only computed
+when they are requested (GET /health/metrics), so the per-request cost is
+a single deque append and clients don't each receive a timing header.
+
+Samples are kept in memory per worker process.
+
+Usage:
+    record_request_time(duration_us)
+    ...
+    request_time_percentiles()
+    # {"samples": 10000, "p50_us": 812, "p95_us": 4120, ...}
+"""
+
+from collections import deque
+from typing import Deque, Dict
+
+# ============================================================
+# Request Timings
+# ============================================================
+
+# Number of most recent request durations kept for percentiles
+REQUEST_TIME_SAMPLES = 10_000
+
+# Durations in microseconds; the oldest sample is dropped when full
+_request_times_us: Deque[int] = deque(maxlen=REQUEST_TIME_SAMPLES)
+
+
+def record_request_time(duration_us: int) -> None:
+    """
+    Record the duration of one request.
+
+    Args:
+        duration_us: Request duration in microseconds
+    """
+    _request_times_us.append(duration_us)
+
+
+def request_time_percentiles() -> Dict[str, int]:
+    """
+    Summarize the recorded request durations.
+
+    Percentiles pick the sample at that rank (no interpolation) over the
+    most recent REQUEST_TIME_SAMPLES requests. Call from the event loop
+    thread (the same thread the middleware records from), since a deque
+    cannot be copied while another thread appends to it.
+
+    Returns:
+        dict: Sample count and p50/p95/p99/max durations in microseconds
+            (all 0 if no request has been recorded yet)
+
+    Example:
+        >>> request_time_percentiles()
+        {'samples': 3, 'p50_us': 410, 'p95_us': 930, 'p99_us': 930, 'max_us': 930}
+    """
+    times = sorted(_request_times_us)
+    if not times:
+        return {"samples": 0, "p50_us": 0, "p95_us": 0, "p99_us": 0, "max_us": 0}
+
+    last = len(times) - 1
+    return {
+        "samples": len(times),
+        "p50_us": times[last * 50 // 100],
+        "p95_us": times[last * 95 // 100],
+        "p99_us": times[last * 99 // 100],
+        "max_us": times[last]
+    }
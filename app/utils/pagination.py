@@ -0,0 +1,84 @@
+"""
+Pagination Utilities
+====================
+
+This module provides helpers for keyset (cursor) pagination.
+
+Keyset pagination resumes a listing from the last row of the previous page
+instead of skipping a number of rows with OFFSET. The database can then seek
+directly into an index on the sort columns, so every page costs the same
+regardless of how deep the client has paged.
+
+Cursor Format:
+- Opaque, URL-safe base64 string
+- Encodes the sort key of the last returned row: "<created_at ISO>|<id>"
+
+Usage in API routes:
+    cursor_ts, cursor_id = decode_cursor(cursor)
+    query = query.filter(tuple_(Model.created_at, Model.id) < (cursor_ts, cursor_id))
+    ...
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+"""
+
+from datetime import datetime
+from typing import Tuple
+from fastapi import HTTPException, status
+import base64
+import binascii
+import uuid
+
+# ============================================================
+# Constants
+# ============================================================
+
+# Response header carrying the cursor for the next page (absent on last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Response header carrying the total number of matching rows (when requested)
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+# ============================================================
+# Cursor Encoding
+# ============================================================
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """
+    Encode the sort key of a row into an opaque cursor string.
+
+    Args:
+        created_at: Creation timestamp of the last row on the page
+        row_id: Primary key of the last row on the page
+
+    Returns:
+        str: URL-safe base64 cursor
+
+    Example:
+        >>> cursor = encode_cursor(company.created_at, company.id)
+    """
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        tuple: (created_at, id) sort key of the last row of the previous page
+
+    Raises:
+        HTTPException 400: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
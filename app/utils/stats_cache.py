@@ -0,0 +1,131 @@
+"""
+Company Statistics Cache
+========================
+
+This module holds the per-worker cache behind GET /companies/{id}/stats.
+
+Dashboards poll the stats endpoint far more often than users/devices
+change, so computed stats are memoized per company for a short TTL and
+dropped as soon as a user, device or company row of that company changes.
+It lives here rather than in the companies router so that the users and
+devices routers can drop entries after their own Core statements.
+
+As with the user lookup cache (app.utils.user_cache), entries are dropped
+only after the change has been committed: evicting at flush time would
+let a concurrent request recompute the stats from the still-committed
+old rows and cache them for the whole TTL. Companies of flushed User,
+Device and Company rows are collected on the session and evicted once
+its transaction commits.
+
+Usage:
+    from app.utils.stats_cache import company_stats_cache, invalidate_company_stats
+
+    stats = company_stats_cache.get(company_id)
+    ...
+    db.execute(update(Device).where(Device.company_id == company_id).values(...))
+    db.commit()
+    invalidate_company_stats(company_id)
+"""
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from typing import Optional
+import uuid
+
+from app.config import settings
+from app.models.company import Company
+from app.models.device import Device
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+# ============================================================
+# Cache
+# ============================================================
+
+# CompanyStatsResponse dict per company id
+company_stats_cache = TTLCache(ttl_seconds=settings.STATS_CACHE_TTL_SECONDS)
+
+# Session.info key collecting the company ids to evict on commit
+_PENDING_KEY = "stale_stats_company_ids"
+
+
+def invalidate_company_stats(company_id: Optional[uuid.UUID]) -> None:
+    """
+    Drop cached stats for a company.
+
+    Mapper events only fire for unit-of-work flushes; call this after
+    committing Core INSERT/UPDATE/DELETE statements that change a
+    company's users or devices.
+
+    Args:
+        company_id: Company UUID (no-op if None)
+    """
+    if company_id is not None:
+        company_stats_cache.delete(company_id)
+
+
+def invalidate_company_stats_after_commit(db: Session, company_id: Optional[uuid.UUID]) -> None:
+    """
+    Drop cached stats for a company once the session's transaction commits.
+
+    Nothing is dropped if the transaction is rolled back.
+
+    Args:
+        db: Session running the change
+        company_id: Company UUID (no-op if None)
+    """
+    if company_id is not None:
+        db.info.setdefault(_PENDING_KEY, set()).add(company_id)
+
+
+# ============================================================
+# Session Events
+# ============================================================
+
+def _invalidate_flushed_row(mapper, connection, target) -> None:
+    """
+    Schedule a stats eviction, for after commit, for every company the
+    flushed row belongs (or belonged) to.
+
+    Registered as an after_insert/after_update/after_delete listener on
+    User, Device and Company.
+    """
+    if isinstance(target, Company):
+        company_ids = (target.id,)
+    else:
+        history = inspect(target).attrs.company_id.history
+        company_ids = (target.company_id, *history.deleted)
+
+    db = object_session(target)
+    for company_id in company_ids:
+        if db is not None:
+            invalidate_company_stats_after_commit(db, company_id)
+        else:
+            invalidate_company_stats(company_id)
+
+
+def _evict_committed_companies(db: Session) -> None:
+    """
+    Drop cached stats of the companies changed by a transaction that just committed.
+
+    Registered as an after_commit listener on Session.
+    """
+    for company_id in db.info.pop(_PENDING_KEY, ()):
+        company_stats_cache.delete(company_id)
+
+
+def _discard_pending_companies(db: Session, *args) -> None:
+    """
+    Drop scheduled evictions of a transaction that was rolled back.
+
+    Registered as an after_rollback listener on Session.
+    """
+    db.info.pop(_PENDING_KEY, None)
+
+
+for _model in (User, Device, Company):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _invalidate_flushed_row)
+
+event.listen(Session, "after_commit", _evict_committed_companies)
+event.listen(Session, "after_rollback", _discard_pending_companies)
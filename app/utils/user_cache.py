@@ -0,0 +1,132 @@
+"""
+User Lookup Cache
+=================
+
+This module holds the per-worker cache behind GET /users/{id}.
+
+Frontends resolve user ids to names/avatars through GET /users/{id} far
+more often than users change, so the serialized user is memoized per id
+for a short TTL. It lives here rather than in the users router so that
+other routers whose statements change users (company deactivation and
+deletion) can drop entries too.
+
+Entries are dropped only after the change has been committed: evicting
+earlier would let a concurrent request read the still-committed old row
+and put it back for the whole TTL. Flushed User updates/deletes and
+ids passed to forget_user_after_commit() are collected on the session
+and evicted (together with the authenticated user cache entry) once its
+transaction commits.
+
+Usage:
+    from app.utils.user_cache import user_lookup_cache, forget_user_after_commit
+
+    user = user_lookup_cache.get(user_id)
+    ...
+    db.execute(update(User).where(User.id == user_id).values(...))
+    forget_user_after_commit(db, user_id)
+    db.commit()
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+import uuid
+
+from app.config import settings
+from app.models.user import User
+from app.utils.auth import forget_cached_user
+from app.utils.cache import TTLCache
+
+# ============================================================
+# Cache
+# ============================================================
+
+# UserResponse per user id
+user_lookup_cache = TTLCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES
+)
+
+# Session.info key collecting the user ids to evict on commit
+_PENDING_KEY = "forget_user_ids"
+
+
+def forget_user_lookup(user_id: uuid.UUID) -> None:
+    """
+    Drop a user from the lookup cache now.
+
+    Only call this after the change to the user has been committed.
+
+    Args:
+        user_id: User UUID
+    """
+    user_lookup_cache.delete(user_id)
+
+
+def forget_all_user_lookups() -> None:
+    """
+    Empty the lookup cache.
+
+    For committed bulk changes that affect many users at once (e.g.
+    deactivating or deleting a company), where listing the affected ids
+    is not worth it.
+    """
+    user_lookup_cache.clear()
+
+
+def forget_user_after_commit(db: Session, user_id: uuid.UUID) -> None:
+    """
+    Evict a user from the lookup and authenticated user caches once the
+    session's transaction commits.
+
+    Needed after Core UPDATE/DELETE statements, which do not fire mapper
+    events. Nothing is evicted if the transaction is rolled back.
+
+    Args:
+        db: Session running the change
+        user_id: User UUID
+    """
+    db.info.setdefault(_PENDING_KEY, set()).add(user_id)
+
+
+# ============================================================
+# Session Events
+# ============================================================
+
+def _forget_flushed_user(mapper, connection, target) -> None:
+    """
+    Schedule eviction of a flushed user for after commit.
+
+    Registered as an after_update/after_delete listener on User.
+    """
+    db = object_session(target)
+    if db is not None:
+        forget_user_after_commit(db, target.id)
+    else:
+        forget_user_lookup(target.id)
+
+
+def _evict_committed_users(db: Session) -> None:
+    """
+    Evict the users changed by a transaction that just committed.
+
+    Registered as an after_commit listener on Session.
+    """
+    for user_id in db.info.pop(_PENDING_KEY, ()):
+        forget_user_lookup(user_id)
+        forget_cached_user(user_id)
+
+
+def _discard_pending_users(db: Session, *args) -> None:
+    """
+    Drop scheduled evictions of a transaction that was rolled back.
+
+    Registered as an after_rollback listener on Session.
+    """
+    db.info.pop(_PENDING_KEY, None)
+
+
+for _event_name in ("after_update", "after_delete"):
+    event.listen(User, _event_name, _forget_flushed_user)
+
+event.listen(Session, "after_commit", _evict_committed_users)
+event.listen(Session, "after_rollback", _discard_pending_users)
@@ -15,12 +15,13 @@ import sys
 import argparse
 from datetime import datetime, timedelta
 import secrets
+from urllib.parse import urlsplit
 
 # Add app to path
 sys.path.insert(0, '.')
 
-from sqlalchemy import create_engine, text
-from app.database import Base, get_db
+from sqlalchemy import create_engine, func, select, text
+from app.database import Base, create_missing_indexes, get_db
 from app.config import settings
 from app.models.user import User, UserRole
 from app.models.company import Company
@@ -75,6 +76,10 @@ def create_tables(engine, reset=False):
     print("[*] Creating tables...")
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips existing tables, so add indexes introduced since
+    print("[*] Creating missing indexes...")
+    create_missing_indexes(engine)
+
     # List all created tables
     from sqlalchemy import inspect
     inspector = inspect(engine)
@@ -88,12 +93,11 @@ def create_tables(engine, reset=False):
     return True
 
 
-def create_sample_data():
+def create_sample_data(engine):
     """Create sample data for testing"""
     print_header("Creating Sample Data")
 
     from sqlalchemy.orm import Session
-    engine = create_engine(settings.DATABASE_URL)
     db = Session(bind=engine)
 
     try:
@@ -121,7 +125,6 @@ def create_sample_data():
             last_login=datetime.utcnow()
         )
         db.add(super_admin)
-        db.flush()
         print(f"   [OK] Super Admin created: {super_admin.email}")
 
         # 2. Create Companies
@@ -148,12 +151,13 @@ def create_sample_data():
             }
         ]
 
-        companies = []
-        for company_data in companies_data:
-            company = Company(**company_data)
-            db.add(company)
-            db.flush()
-            companies.append(company)
+        companies = [Company(**company_data) for company_data in companies_data]
+        db.add_all(companies)
+
+        # One flush inserts the super admin and all companies (batched per
+        # table) and assigns the ids the rows below reference
+        db.flush()
+        for company in companies:
             print(f"   [OK] Company created: {company.name} ({company.subdomain})")
 
         # 3. Create Company Admins
@@ -193,10 +197,9 @@ def create_sample_data():
                 is_active=True,
                 last_login=datetime.utcnow()
             )
-            db.add(admin)
-            db.flush()
             admins.append(admin)
             print(f"   [OK] Admin created: {admin.email} for {company.name}")
+        db.add_all(admins)
 
         # 4. Create Regular Users
         print("\n[4] Creating regular users...")
@@ -242,10 +245,12 @@ def create_sample_data():
                 is_active=True,
                 last_login=datetime.utcnow()
             )
-            db.add(user)
-            db.flush()
             users.append(user)
             print(f"   [OK] User created: {user.email} for {company.name}")
+        db.add_all(users)
+
+        # One flush for all admins and users, for the ids referenced below
+        db.flush()
 
         # 5. Create Sample Devices
         print("\n[5] Creating sample devices...")
@@ -394,22 +399,27 @@ def create_sample_data():
         db.close()
 
 
-def display_database_stats():
+def display_database_stats(engine):
     """Display statistics about the database"""
     print_header("Database Statistics")
 
     from sqlalchemy.orm import Session
-    engine = create_engine(settings.DATABASE_URL)
     db = Session(bind=engine)
 
     try:
-        stats = {
-            "Users": db.query(User).count(),
-            "Companies": db.query(Company).count(),
-            "Devices": db.query(Device).count(),
-            "Invitations": db.query(Invitation).count(),
-            "Audit Logs": db.query(AuditLog).count()
+        # All table counts in one round-trip (one scalar subquery each)
+        models = {
+            "Users": User,
+            "Companies": Company,
+            "Devices": Device,
+            "Invitations": Invitation,
+            "Audit Logs": AuditLog
         }
+        counts = db.execute(select(*(
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in models.values()
+        ))).one()
+        stats = dict(zip(models, counts))
 
         print("Current database contents:\n")
         for key, value in stats.items():
@@ -418,8 +428,11 @@ def display_database_stats():
         # Show user breakdown
         if stats["Users"] > 0:
             print("\n📊 User breakdown:")
+            role_counts = dict(db.execute(
+                select(User.role, func.count()).group_by(User.role)
+            ).all())
             for role in UserRole:
-                count = db.query(User).filter(User.role == role).count()
+                count = role_counts.get(role, 0)
                 if count > 0:
                     print(f"   {role.value:.<30} {count:>5}")
 
@@ -457,17 +470,19 @@ def main():
     print_header("Simple Digital Signage - Database Initialization")
 
     print(f"📍 Environment: {settings.APP_ENV}")
-    print(f"🗄️  Database: {settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'Unknown'}")
+    # Show host and database name only (never the credentials in the URL)
+    db_url = urlsplit(settings.DATABASE_URL)
+    print(f"🗄️  Database: {db_url.hostname + db_url.path if db_url.hostname else 'Unknown'}")
     print()
 
-    # Check database connection
+    # Check database connection (the returned engine is shared by every step)
     engine = check_database_connection()
     if not engine:
         sys.exit(1)
 
     # Show stats only
     if args.stats:
-        display_database_stats()
+        display_database_stats(engine)
         return
 
     # Create tables
@@ -476,10 +491,10 @@ def main():
 
     # Create sample data if requested
     if args.sample_data:
-        create_sample_data()
+        create_sample_data(engine)
 
     # Show final stats
-    display_database_stats()
+    display_database_stats(engine)
 
     print_header("Setup Complete!")
 
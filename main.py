@@ -17,20 +17,32 @@ Run the application:
     uvicorn main:app --reload --host 0.0.0.0 --port 8000
 """
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
+import asyncio
+import atexit
 import logging
+import orjson
+import os
+import queue
+import socket
 import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import AsyncGenerator
 from pathlib import Path
 
 from app.config import settings
 from app.database import init_db, check_db_connection
-from app.utils.encryption import validate_encryption_key
+from app.utils.email import start_email_worker, stop_email_worker
+from app.utils.encryption import validate_crypto_backend, validate_encryption_key
+from app.utils.etag import compute_etag, etag_response
+from app.utils.metrics import record_request_time
+from app.utils.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 
 # Import routers
 from app.routers import (
@@ -45,12 +57,32 @@ from app.routers import (
 # ============================================================
 # Logging Configuration
 # ============================================================
+# Log records are handed to a queue and written to stderr by a background
+# listener thread, so request handlers on the event loop never block on
+# the stream write
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flush queued records on exit
+
+# The queue handler only merges message and traceback; the listener's
+# handler applies the full format
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
+# Settings don't change at runtime; read once for the per-request paths below
+_IS_PRODUCTION = settings.APP_ENV == "production"
+
 
 # ============================================================
 # Application Lifespan Events
@@ -62,27 +94,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Application lifespan manager for startup and shutdown events.
 
     Startup:
-    - Validate encryption key
-    - Check database connection
+    - Validate encryption key and check database connection (concurrently)
+    - Check AES hardware acceleration
     - Initialize database tables
+    - Start the database heartbeat used by health probes
+    - Start the background email worker
     - Log application info
 
     Shutdown:
-    - Close connections
+    - Stop the database heartbeat
+    - Send queued emails and stop the email worker
+    - Close connections (including the shared SMTP connection)
     - Cleanup resources
     """
     # Startup
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info(f"Environment: {settings.APP_ENV}")
+    logger.info("Starting %s v%s", settings.APP_NAME, settings.APP_VERSION)
+    logger.info("Environment: %s", settings.APP_ENV)
 
     try:
-        # Validate encryption key
-        if not validate_encryption_key():
+        # Validate encryption key (CPU-bound key derivation) and check the
+        # database connection (network round-trip) concurrently; neither
+        # depends on the other
+        key_valid, db_connected = await asyncio.gather(
+            asyncio.to_thread(validate_encryption_key),
+            asyncio.to_thread(check_db_connection)
+        )
+
+        if not key_valid:
             raise ValueError("Invalid encryption key configuration")
         logger.info("Encryption key validated")
 
-        # Check database connection
-        if not check_db_connection():
+        # Warn (but keep running) if AES-GCM can't use hardware AES
+        validate_crypto_backend()
+
+        if not db_connected:
             raise ConnectionError("Cannot connect to database")
         logger.info("Database connection established")
 
@@ -92,16 +137,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
             init_db()
             logger.info("Database initialized")
 
-        logger.info(f"Application started successfully on {settings.HOST}:{settings.PORT}")
+        # Start background database heartbeat for health probes
+        heartbeat_task = asyncio.create_task(health.run_db_heartbeat())
+
+        # Start background worker for queued emails
+        start_email_worker()
+
+        logger.info("Application started successfully on %s:%s", settings.HOST, settings.PORT)
 
     except Exception as e:
-        logger.error(f"Application startup failed: {e}")
+        logger.error("Application startup failed: %s", e)
         raise
 
     yield
 
     # Shutdown
     logger.info("Application shutting down...")
+    heartbeat_task.cancel()
+    stop_email_worker()
 
 
 # ============================================================
@@ -114,6 +167,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/api/docs" if settings.DEBUG else None,  # Disable in production
     redoc_url="/api/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -128,6 +182,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, "ETag"],
 )
 
 
@@ -135,64 +190,148 @@ app.add_middleware(
 # Custom Middleware
 # ============================================================
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """
-    Add X-Process-Time header to all responses.
-    Useful for monitoring API performance.
-    """
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# Constant fields of the per-request JSON log line
+_HOSTNAME = socket.gethostname()
+_PID = os.getpid()
+
+# Outside production every response carries X-Process-Time; in production
+# only requests sent with "X-Trace: 1" get it
+_TRACE_HEADER = (b"x-trace", b"1")
+
+# Documentation and static asset paths are neither timed nor logged
+_UNOBSERVED_PATH_PREFIXES = ("/api/docs", "/api/redoc", "/openapi.json", "/favicon.ico", "/static/")
 
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+class ObservabilityMiddleware:
     """
-    Log all incoming requests.
+    Record the duration of each API request and log it.
+
+    Durations (in whole microseconds, measured with the monotonic
+    perf_counter_ns clock) go into the rolling sample behind
+    GET /health/metrics. One log line per request is written once the
+    response has been sent: a JSON object (encoded with orjson, so log
+    ingestion can parse it directly) with the host, process id, timestamp
+    in ns, method, path, client, status and total duration.
+
+    The X-Process-Time header (time until the response started, in
+    microseconds) is added outside production, and in production only
+    for requests that send "X-Trace: 1".
+
+    Requests for _UNOBSERVED_PATH_PREFIXES (API docs, static assets)
+    are passed straight through.
+
+    Pure ASGI middleware: everything is read from the scope and the
+    response start message, so no Request/Response objects are created
+    and streaming responses pass through untouched. Timing and logging
+    share one middleware layer instead of wrapping each request twice.
     """
-    logger.info(f"{request.method} {request.url.path} - {request.client.host}")
-    response = await call_next(request)
-    logger.info(f"{request.method} {request.url.path} - Status: {response.status_code}")
-    return response
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(_UNOBSERVED_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = None
+        send_process_time = not _IS_PRODUCTION or _TRACE_HEADER in scope["headers"]
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if send_process_time:
+                    process_time_us = (time.perf_counter_ns() - start_ns) // 1000
+                    # Append the pre-encoded pair to the raw ASGI header list
+                    message["headers"] = [
+                        *message.get("headers", ()),
+                        (b"x-process-time", b"%d" % process_time_us)
+                    ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        duration_us = (time.perf_counter_ns() - start_ns) // 1000
+        record_request_time(duration_us)
+
+        # Skip building the log record when INFO is filtered out
+        # (isEnabledFor is cached by the logging module)
+        if logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            logger.info(orjson.dumps({
+                "host": _HOSTNAME,
+                "pid": _PID,
+                "t": time.time_ns(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "client": client[0] if client else None,
+                "status": status_code,
+                "dur_us": duration_us
+            }).decode())
+
+
+app.add_middleware(ObservabilityMiddleware)
 
 
 # ============================================================
 # Exception Handlers
 # ============================================================
 
+# Longest raw request body echoed back in a validation error
+MAX_ERROR_BODY_LENGTH = 4096
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
     Handle validation errors with detailed error messages.
+
+    A raw (unparsed) body is echoed back truncated to
+    MAX_ERROR_BODY_LENGTH, so a large malformed request costs a bounded
+    amount of work. The response is encoded with orjson; values JSON
+    cannot represent (such as the exception in a custom validator's
+    error context) are sent as strings.
     """
-    logger.warning(f"Validation error on {request.url.path}: {exc.errors()}")
-    return JSONResponse(
+    errors = exc.errors()
+    logger.warning("Validation error on %s: %s", request.url.path, errors)
+
+    body = exc.body
+    if isinstance(body, bytes):
+        body = body[:MAX_ERROR_BODY_LENGTH].decode("utf-8", "replace")
+    elif isinstance(body, str):
+        body = body[:MAX_ERROR_BODY_LENGTH]
+
+    return Response(
+        content=orjson.dumps({"detail": errors, "body": body}, default=str),
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "detail": exc.errors(),
-            "body": exc.body
-        }
+        media_type="application/json"
     )
 
 
+# Production 500 body, serialized once
+_INTERNAL_ERROR_BYTES = orjson.dumps({"detail": "Internal server error"})
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle all unhandled exceptions.
     """
-    logger.error(f"Unhandled exception on {request.url.path}: {exc}", exc_info=True)
+    # request.url is built on first access, so only touch it when logging
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("Unhandled exception on %s: %s", request.url.path, exc, exc_info=True)
 
     # Don't expose internal errors in production
-    if settings.APP_ENV == "production":
-        return JSONResponse(
+    if _IS_PRODUCTION:
+        return Response(
+            content=_INTERNAL_ERROR_BYTES,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"}
+            media_type="application/json"
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": str(exc)}
         )
@@ -202,18 +341,29 @@ async def general_exception_handler(request: Request, exc: Exception):
 # Root Endpoint
 # ============================================================
 
+# Built from settings only, so serialized (and hashed) once instead of on
+# every request
+_ROOT_BYTES = orjson.dumps({
+    "name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "environment": settings.APP_ENV,
+    "docs": "/api/docs" if settings.DEBUG else "disabled",
+    "status": "running"
+})
+_ROOT_ETAG = compute_etag(_ROOT_BYTES)
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+
 @app.get("/api", tags=["Root"])
-async def root():
+async def root(request: Request):
     """
     API root endpoint - API information.
+
+    The body only changes on redeploy, so it is sent with an ETag and a
+    short Cache-Control lifetime; a matching If-None-Match header gets an
+    empty 304 response.
     """
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "environment": settings.APP_ENV,
-        "docs": "/api/docs" if settings.DEBUG else "disabled",
-        "status": "running"
-    }
+    return etag_response(request, _ROOT_BYTES, etag=_ROOT_ETAG, headers=_ROOT_HEADERS)
 
 
 # ============================================================
@@ -223,41 +373,19 @@ async def root():
 # API v1 routes
 API_V1_PREFIX = "/api/v1"
 
-app.include_router(
-    health.router,
-    prefix=API_V1_PREFIX,
-    tags=["Health"]
-)
-
-app.include_router(
-    auth.router,
-    prefix=f"{API_V1_PREFIX}/auth",
-    tags=["Authentication"]
-)
-
-app.include_router(
-    companies.router,
-    prefix=f"{API_V1_PREFIX}/companies",
-    tags=["Companies"]
-)
-
-app.include_router(
-    users.router,
-    prefix=f"{API_V1_PREFIX}/users",
-    tags=["Users"]
-)
-
-app.include_router(
-    devices.router,
-    prefix=f"{API_V1_PREFIX}/devices",
-    tags=["Devices"]
+# (router, path under API_V1_PREFIX, OpenAPI tag); every router inherits
+# the app's ORJSONResponse default
+API_V1_ROUTERS = (
+    (health.router, "", "Health"),
+    (auth.router, "/auth", "Authentication"),
+    (companies.router, "/companies", "Companies"),
+    (users.router, "/users", "Users"),
+    (devices.router, "/devices", "Devices"),
+    (invitations.router, "/invitations", "Invitations"),
 )
 
-app.include_router(
-    invitations.router,
-    prefix=f"{API_V1_PREFIX}/invitations",
-    tags=["Invitations"]
-)
+for router, path, tag in API_V1_ROUTERS:
+    app.include_router(router, prefix=API_V1_PREFIX + path, tags=[tag])
 
 
 # ============================================================
@@ -275,9 +403,9 @@ if frontend_path.exists():
         """Serve the frontend application."""
         return FileResponse(str(frontend_path / "index.html"))
 
-    logger.info(f"Frontend UI mounted at / from {frontend_path}")
+    logger.info("Frontend UI mounted at / from %s", frontend_path)
 else:
-    logger.warning(f"Frontend directory not found at {frontend_path}")
+    logger.warning("Frontend directory not found at %s", frontend_path)
 
 
 # ============================================================
@@ -287,10 +415,19 @@ else:
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http "auto" use uvloop and httptools when they are installed and
+    # fall back to the pure-Python implementations otherwise (see
+    # requirements.txt). Requests are already logged by ObservabilityMiddleware,
+    # so uvicorn's access log is turned off.
     uvicorn.run(
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        server_header=False,
         log_level=settings.LOG_LEVEL.lower()
     )